@@ -1,13 +1,13 @@
 """FastAPI app combining analysis endpoints with position monitor."""
 from __future__ import annotations
 
-import json
-from pathlib import Path
 from typing import List
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from automation.decision_log import read_recent
 from signals.api import app as signals_app
 from .store import (
     list_positions,
@@ -18,6 +18,7 @@ from .store import (
     toggle_position,
     get_settings,
     update_settings,
+    monitor_snapshot,
     PositionIn,
     PositionOut,
     SettingsOut,
@@ -29,7 +30,7 @@ from .monitor import (
     run_monitor_once,
 )
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -106,16 +107,16 @@ def monitor_run_once() -> dict:
 # Decisions history
 @app.get("/decisions/recent")
 def decisions_recent(limit: int = 50) -> List[dict]:
-    logs = Path("logs/sell_decisions")
-    items: List[dict] = []
-    if logs.exists():
-        for file in sorted(logs.glob("run_*.json"), reverse=True):
-            try:
-                with open(file, "r") as f:
-                    data = json.load(f)
-                    items.extend(data)
-            except Exception:
-                continue
-            if len(items) >= limit:
-                break
-    return items[:limit]
+    return read_recent(limit)
+
+
+# Everything the monitor view shows, in one round trip
+@app.get("/bootstrap")
+def bootstrap(limit: int = 50) -> dict:
+    settings, positions = monitor_snapshot()
+    return {
+        "positions": positions,
+        "settings": settings,
+        "status": status_monitor(),
+        "recent": read_recent(limit),
+    }
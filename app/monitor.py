@@ -1,15 +1,19 @@
 """Background scheduler to monitor positions."""
 from __future__ import annotations
 
+import contextvars
 import datetime as dt
 import json
-import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+import orjson
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
+from signals.analysis import shared_history
 from signals.sell_decision import (
     Position,
     PositionType,
@@ -17,15 +21,23 @@ from signals.sell_decision import (
     get_live_snapshot,
     decide_sell,
 )
+from automation.decision_log import append_decisions, write_run
 from automation.notifier import send_slack, send_email, send_telegram
 from .store import (
-    list_positions,
+    DB_PATH,
     get_settings,
+    monitor_snapshot,
     PositionOut,
+    SettingsOut,
 )
 
 scheduler: Optional[BackgroundScheduler] = None
 JOB_ID = "position-monitor"
+# textual reference so the persisted job survives restarts
+JOB_FUNC = "app.monitor:run_monitor_once"
+
+_CFG = SellConfig()
+MAX_WORKERS = 16
 
 
 def _build_position(p: PositionOut) -> Position:
@@ -45,36 +57,51 @@ def _build_position(p: PositionOut) -> Position:
     return pos
 
 
+def _evaluate_one(p: PositionOut, settings: SettingsOut) -> Dict[str, Any]:
+    """Decide on one position and send any SELL_NOW alerts."""
+    pos = _build_position(p)
+    snap = get_live_snapshot(pos)
+    decision = decide_sell(pos, _CFG, prev_peak=p.previous_peak)
+    payload = {
+        "position_id": p.id,
+        "ticker": pos.ticker,
+        "decision": decision["action"],
+        "snapshot": decision["snapshot"],
+        "rationale": decision.get("rationale", []),
+        "ts": dt.datetime.utcnow().isoformat(),
+    }
+    if decision["action"] == "SELL_NOW":
+        title = f"SELL_NOW: {pos.ticker} {p.type} {p.long_strike} {p.expiry}"
+        if settings.notify_slack:
+            send_slack(title)
+        if settings.notify_email:
+            pretty = orjson.dumps(payload, default=str, option=orjson.OPT_INDENT_2).decode()
+            send_email(title, pretty)
+        if settings.notify_telegram:
+            # the chat copy goes over the wire, so skip the indentation
+            send_telegram(f"{title}\n{orjson.dumps(payload, default=str).decode()}")
+    return payload
+
+
 def run_monitor_once() -> List[Dict[str, Any]]:
     """Evaluate all enabled positions once."""
-    settings = get_settings()
-    positions = [p for p in list_positions() if p.enabled]
+    settings, positions = monitor_snapshot()
+    positions = [p for p in positions if p.enabled]
     results: List[Dict[str, Any]] = []
-    for p in positions:
-        pos = _build_position(p)
-        snap = get_live_snapshot(pos)
-        decision = decide_sell(pos, SellConfig(), prev_peak=p.previous_peak)
-        payload = {
-            "position_id": p.id,
-            "ticker": pos.ticker,
-            "decision": decision["action"],
-            "snapshot": decision["snapshot"],
-            "rationale": decision.get("rationale", []),
-            "ts": dt.datetime.utcnow().isoformat(),
-        }
-        results.append(payload)
-        if decision["action"] == "SELL_NOW":
-            title = f"SELL_NOW: {pos.ticker} {p.type} {p.long_strike} {p.expiry}"
-            if settings.notify_slack:
-                send_slack(title)
-            if settings.notify_email:
-                send_email(title, json.dumps(payload, indent=2))
-            if settings.notify_telegram:
-                send_telegram(f"{title}\n{json.dumps(payload, indent=2)}")
-    os.makedirs("logs/sell_decisions", exist_ok=True)
-    stamp = dt.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    with open(f"logs/sell_decisions/run_{stamp}.json", "w") as f:
-        json.dump(results, f, indent=2)
+    if positions:
+        # each position waits on Yahoo, so fan the network calls out;
+        # positions on the same underlying share one history fetch per cycle
+        with shared_history(), ThreadPoolExecutor(
+            max_workers=min(MAX_WORKERS, len(positions))
+        ) as ex:
+            # copy the context per task so workers see this run's history memo
+            futures = [
+                ex.submit(contextvars.copy_context().run, _evaluate_one, p, settings)
+                for p in positions
+            ]
+            results = [f.result() for f in futures]
+    write_run(results)
+    append_decisions(results)
     return results
 
 
@@ -88,9 +115,22 @@ def start_monitor() -> Dict[str, Any]:
     else:
         if scheduler and scheduler.running:
             scheduler.shutdown(wait=False)
-        scheduler = BackgroundScheduler()
-        scheduler.add_job(run_monitor_once, IntervalTrigger(minutes=interval), id=JOB_ID)
-        scheduler.start()
+        scheduler = BackgroundScheduler(
+            jobstores={"default": SQLAlchemyJobStore(url=f"sqlite:///{DB_PATH}")},
+            # collapse intervals missed while the process was down into one run
+            job_defaults={"coalesce": True, "max_instances": 1, "misfire_grace_time": 60},
+        )
+        scheduler.start(paused=True)
+        job = scheduler.get_job(JOB_ID)
+        # a persisted job with the same interval keeps its next run time
+        if not job or job.trigger.interval != dt.timedelta(minutes=interval):
+            scheduler.add_job(
+                JOB_FUNC,
+                IntervalTrigger(minutes=interval),
+                id=JOB_ID,
+                replace_existing=True,
+            )
+        scheduler.resume()
     return {"running": True, "interval": interval}
 
 
@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import os
+import threading
+import time
 from pathlib import Path
 
 from sqlalchemy import (
     create_engine,
+    event,
     Column,
     Integer,
     String,
@@ -23,8 +26,26 @@ from pydantic import BaseModel, validator
 db_dir = Path("data")
 db_dir.mkdir(exist_ok=True)
 
-DATABASE_URL = "sqlite:///data/positions.db"
-engine = create_engine(DATABASE_URL, future=True)
+DB_PATH = db_dir / "positions.db"
+DATABASE_URL = f"sqlite:///{DB_PATH}"
+# The API thread and the scheduler thread share this engine.
+engine = create_engine(
+    DATABASE_URL,
+    future=True,
+    connect_args={"check_same_thread": False},
+)
+
+
+@event.listens_for(engine, "connect")
+def _sqlite_pragmas(dbapi_conn, _record) -> None:
+    # WAL lets readers proceed while a writer holds the lock
+    cur = dbapi_conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA mmap_size=268435456")
+    cur.close()
+
 Base = declarative_base()
 
 
@@ -95,32 +116,83 @@ class SettingsOut(BaseModel):
     notify_telegram: int
 
 
+_POSITION_COLUMNS = tuple(PositionORM.__table__.columns)
+
+# (expires_at, settings, positions) shared by monitor poll cycles
+_read_cache: Optional[Tuple[float, SettingsOut, List[PositionOut]]] = None
+_read_lock = threading.Lock()
+# bumped on every write so a snapshot read that overlapped one is not cached
+_read_gen = 0
+
+
+def _invalidate_reads() -> None:
+    global _read_cache, _read_gen
+    with _read_lock:
+        _read_cache = None
+        _read_gen += 1
+
+
+def _to_out(row: PositionORM) -> PositionOut:
+    # rows were validated on write, so skip re-running validators
+    return PositionOut.model_construct(**{c.key: getattr(row, c.key) for c in _POSITION_COLUMNS})
+
+
 # CRUD helpers
 
 def list_positions() -> List[PositionOut]:
     with Session(engine) as ses:
-        rows = ses.execute(select(PositionORM)).scalars().all()
-        return [PositionOut(**row.__dict__) for row in rows]
+        rows = ses.execute(select(*_POSITION_COLUMNS)).mappings().all()
+    # rows were validated on write, so skip re-running validators
+    return [PositionOut.model_construct(**row) for row in rows]
+
+
+def monitor_snapshot() -> Tuple[SettingsOut, List[PositionOut]]:
+    """Return settings and positions, memoised for a quarter poll interval.
+
+    Any write through this module invalidates the cached pair.
+    """
+    global _read_cache
+    now = time.monotonic()
+    with _read_lock:
+        if _read_cache is not None and _read_cache[0] > now:
+            return _read_cache[1], _read_cache[2]
+        gen = _read_gen
+    settings = get_settings()
+    positions = list_positions()
+    with _read_lock:
+        if gen == _read_gen:
+            _read_cache = (now + settings.poll_minutes * 60 / 4, settings, positions)
+    return settings, positions
 
 
 def get_position(pid: int) -> Optional[PositionOut]:
     with Session(engine) as ses:
         row = ses.get(PositionORM, pid)
-        return PositionOut(**row.__dict__) if row else None
+        return _to_out(row) if row else None
+
+
+def _normalize(data: Dict[str, Any]) -> Dict[str, Any]:
+    if data.get("ticker"):
+        data = {**data, "ticker": data["ticker"].upper()}
+    return data
 
 
 def create_position(data: Dict[str, Any]) -> PositionOut:
     now = dt.datetime.utcnow().isoformat()
+    data = _normalize(data)
     obj = PositionORM(**data, created_at=now, updated_at=now)
     with Session(engine) as ses:
         ses.add(obj)
         ses.commit()
+        # after the commit, so a concurrent snapshot cannot re-cache old rows
+        _invalidate_reads()
         ses.refresh(obj)
-        return PositionOut(**obj.__dict__)
+        return _to_out(obj)
 
 
 def update_position(pid: int, data: Dict[str, Any]) -> Optional[PositionOut]:
     now = dt.datetime.utcnow().isoformat()
+    data = _normalize(data)
     with Session(engine) as ses:
         ses.execute(
             sql_update(PositionORM)
@@ -128,14 +200,16 @@ def update_position(pid: int, data: Dict[str, Any]) -> Optional[PositionOut]:
             .values(**data, updated_at=now)
         )
         ses.commit()
+        _invalidate_reads()
         row = ses.get(PositionORM, pid)
-        return PositionOut(**row.__dict__) if row else None
+        return _to_out(row) if row else None
 
 
 def delete_position(pid: int) -> None:
     with Session(engine) as ses:
         ses.execute(sql_delete(PositionORM).where(PositionORM.id == pid))
         ses.commit()
+    _invalidate_reads()
 
 
 def toggle_position(pid: int, enabled: int) -> Optional[PositionOut]:
@@ -167,6 +241,7 @@ def update_settings(**vals: Any) -> SettingsOut:
         for k, v in vals.items():
             setattr(row, k, v)
         ses.commit()
+        _invalidate_reads()
         ses.refresh(row)
         return SettingsOut(
             poll_minutes=row.poll_minutes,
@@ -0,0 +1,67 @@
+"""Sell decision logs: per-run JSON files plus an append-only JSONL sink."""
+import datetime as dt
+import os
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List
+
+import orjson
+
+RUN_DIR = Path("logs/sell_decisions")
+DECISION_LOG = Path("logs/sell_decisions.jsonl")
+
+
+def _open(path: Path, mode: str) -> BinaryIO:
+    # create the directory only on the first miss rather than on every run
+    try:
+        return open(path, mode)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return open(path, mode)
+
+
+def write_run(results: List[Dict]) -> Path:
+    """Write *results* to a timestamped file under :data:`RUN_DIR`."""
+    stamp = dt.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    path = RUN_DIR / f"run_{stamp}.json"
+    with _open(path, "wb") as f:
+        f.write(orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2))
+    return path
+
+
+def append_decisions(records: Iterable[Dict], path: Path = DECISION_LOG) -> None:
+    """Append one JSON object per decision to *path*."""
+    with _open(path, "ab") as f:
+        for rec in records:
+            f.write(orjson.dumps(rec, default=str, option=orjson.OPT_APPEND_NEWLINE))
+
+
+def read_recent(limit: int = 50, path: Path = DECISION_LOG) -> List[Dict]:
+    """Return the newest *limit* decisions, newest first.
+
+    Only the end of the file is read, so the cost is independent of how much
+    history has accumulated.
+    """
+    if limit <= 0 or not path.exists():
+        return []
+    size = os.path.getsize(path)
+    block = max(limit * 512, 4096)
+    pos = size
+    data = b""
+    with open(path, "rb") as f:
+        while pos > 0 and data.count(b"\n") <= limit:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = data.splitlines()
+    if pos > 0:
+        lines = lines[1:]  # first line may be partial
+    items: List[Dict] = []
+    for line in reversed(lines):
+        if len(items) >= limit:
+            break
+        try:
+            items.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            continue
+    return items
@@ -1,9 +1,15 @@
 import os
-import json
 import smtplib
 import ssl
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
+from requests.adapters import HTTPAdapter
+
+# keep-alive session so repeated alerts reuse the TLS connection
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
 
 def send_slack(text: str):
@@ -11,7 +17,7 @@ def send_slack(text: str):
     if not url:
         return
     try:
-        requests.post(url, json={"text": text}, timeout=10)
+        _session.post(url, json={"text": text}, timeout=10)
     except Exception:
         pass
 
@@ -43,7 +49,7 @@ def send_telegram(text: str):
     if not token or not chat:
         return
     try:
-        requests.post(
+        _session.post(
             f"https://api.telegram.org/bot{token}/sendMessage",
             data={"chat_id": chat, "text": text},
             timeout=10,
@@ -53,8 +59,13 @@ def send_telegram(text: str):
 
 
 def notify(title: str, payload: dict):
-    text = f"*{title}*\n```{json.dumps(payload, indent=2)}```"
-    html = f"<h3>{title}</h3><pre>{json.dumps(payload, indent=2)}</pre>"
-    send_slack(text)
-    send_email(title, html)
-    send_telegram(f"{title}\n{json.dumps(payload, indent=2)}")
+    # serialise once per format; only the email <pre> block needs indenting
+    compact = orjson.dumps(payload, default=str).decode()
+    pretty = orjson.dumps(payload, default=str, option=orjson.OPT_INDENT_2).decode()
+    text = f"*{title}*\n```{compact}```"
+    html = f"<h3>{title}</h3><pre>{pretty}</pre>"
+    # the channels are independent; SMTP alone can take a second
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        ex.submit(send_slack, text)
+        ex.submit(send_email, title, html)
+        ex.submit(send_telegram, f"{title}\n{compact}")
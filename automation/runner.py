@@ -1,6 +1,4 @@
 """Evaluate sell decisions for configured positions and send notifications."""
-import os
-import json
 import datetime as dt
 from typing import List, Dict
 
@@ -14,6 +12,7 @@ from signals.sell_decision import (
     get_live_snapshot,
     decide_sell,
 )
+from .decision_log import append_decisions, write_run
 from .notifier import notify
 
 load_dotenv()
@@ -50,10 +49,8 @@ def run_once(yaml_path: str = "automation/positions.yaml") -> List[Dict]:
         if decision["action"] == "SELL_NOW":
             title = f"SELL_NOW: {pos.ticker} {pos.type} {pos.long_strike} {pos.expiry}"
             notify(title, payload)
-    os.makedirs("logs/sell_decisions", exist_ok=True)
-    stamp = dt.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    with open(f"logs/sell_decisions/run_{stamp}.json", "w") as f:
-        json.dump(results, f, indent=2)
+    write_run(results)
+    append_decisions(results)
     return results
 
 
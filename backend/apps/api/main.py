@@ -1,10 +1,11 @@
 """Minimal FastAPI application exposing the screening endpoint."""
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from .routers import screen
 
-app = FastAPI(title="Stock Recommender API")
+app = FastAPI(title="Stock Recommender API", default_response_class=ORJSONResponse)
 app.include_router(screen.router)
 
 
@@ -4,11 +4,16 @@ from __future__ import annotations
 
 from typing import List
 
+import numpy as np
 import pandas as pd
 from fastapi import APIRouter
 from pydantic import BaseModel
 
-from ...core.signals.qvm import QVMWeights, compute_qvm_scores
+from ....core.signals.qvm import (
+    QVMWeights,
+    compute_qvm_scores,
+    compute_qvm_scores_records,
+)
 
 
 class TickerIn(BaseModel):
@@ -29,12 +34,28 @@ class TickerOut(BaseModel):
 
 router = APIRouter()
 
+# Screens smaller than this skip pandas entirely.
+RECORDS_MAX = 1000
+
 
 @router.post("/screen", response_model=List[TickerOut])
 def screen_endpoint(tickers: List[TickerIn]):
     """Rank the supplied universe using the QVM scoring model."""
 
-    df = pd.DataFrame([t.dict() for t in tickers])
+    if len(tickers) < RECORDS_MAX:
+        return compute_qvm_scores_records([t.model_dump() for t in tickers], QVMWeights())
+
+    # build typed columns directly so pandas skips per-row dicts and inference
+    n = len(tickers)
+    df = pd.DataFrame(
+        {
+            "ticker": [t.ticker for t in tickers],
+            "sector": [t.sector for t in tickers],
+            "quality": np.fromiter((t.quality for t in tickers), dtype=np.float64, count=n),
+            "value": np.fromiter((t.value for t in tickers), dtype=np.float64, count=n),
+            "momentum": np.fromiter((t.momentum for t in tickers), dtype=np.float64, count=n),
+        }
+    )
     result = compute_qvm_scores(df, weights=QVMWeights())
     return result[[
         "ticker",
@@ -1,20 +1,33 @@
 """Enhanced signals router with real data."""
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
 import json
 import logging
 
-from backend.core.database.connection import get_db
+from backend.core.database.connection import get_async_db
 from backend.core.database.models import Signal as SignalModel
 from backend.core.services.stock_data import StockDataService
 from backend.core.signals.analyzer import TechnicalAnalyzer
 from pydantic import BaseModel
 
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+except ImportError:  # pragma: no cover - orjson is optional
+    def _dumps(obj) -> str:
+        return json.dumps(obj, default=str)
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+SIGNAL_CACHE_TTL = 3600
+
 
 class Signal(BaseModel):
     ticker: str
@@ -24,16 +37,63 @@ class Signal(BaseModel):
     reason: str
 
 
+def get_redis(request: Request):
+    """Redis client created at startup, or ``None`` when not configured."""
+    return getattr(request.app.state, "redis", None)
+
+
+async def _cached_signal(redis, ticker: str) -> Optional[Signal]:
+    if redis is None:
+        return None
+    try:
+        cached = await redis.get(f"signal:{ticker}")
+    except Exception as e:
+        logger.warning(f"Signal cache read failed for {ticker}: {e}")
+        return None
+    return Signal.model_validate_json(cached) if cached else None
+
+
+async def _cache_signal(redis, sig: Signal, ttl: int = SIGNAL_CACHE_TTL) -> None:
+    if redis is None:
+        return
+    try:
+        await redis.set(f"signal:{sig.ticker}", sig.model_dump_json(), ex=ttl)
+    except Exception as e:
+        logger.warning(f"Signal cache write failed for {sig.ticker}: {e}")
+
+
+async def _analyze_one(
+    stock_service: StockDataService, analyzer: TechnicalAnalyzer, ticker: str
+) -> Optional[dict]:
+    """Fetch and analyze one ticker; returns ``None`` on failure."""
+    try:
+        logger.info(f"Analyzing {ticker}...")
+        historical_data = await stock_service.get_historical_data(ticker)
+        analysis = analyzer.analyze_stock(ticker, historical_data)
+        logger.info(f"Generated signal for {ticker}: {analysis['signal']}")
+        return analysis
+    except Exception as e:
+        logger.error(f"Error analyzing {ticker}: {e}")
+        return None
+
+
 @router.get("/signals", response_model=List[Signal])
-async def get_top_signals(db: Session = Depends(get_db)):
+async def get_top_signals(
+    db: AsyncSession = Depends(get_async_db), redis=Depends(get_redis)
+):
     """Get top stock signals."""
     logger.info("Fetching top signals...")
     
     try:
         # Get recent signals from database
-        recent_signals = db.query(SignalModel).filter(
-            SignalModel.is_active == True
-        ).order_by(SignalModel.created_at.desc()).limit(10).all()
+        recent_signals = (
+            await db.execute(
+                select(SignalModel)
+                .where(SignalModel.is_active == True)
+                .order_by(SignalModel.created_at.desc())
+                .limit(10)
+            )
+        ).scalars().all()
         
         if recent_signals:
             logger.info(f"Found {len(recent_signals)} recent signals in database")
@@ -51,36 +111,34 @@ async def get_top_signals(db: Session = Depends(get_db)):
         # Generate fresh signals if none in database
         logger.info("No recent signals found, generating fresh ones...")
         popular_tickers = ["AAPL", "MSFT", "GOOGL", "TSLA", "AMZN", "META"]
-        signals = []
         
         async with StockDataService() as stock_service:
             analyzer = TechnicalAnalyzer()
-            
-            for ticker in popular_tickers:
-                try:
-                    logger.info(f"Analyzing {ticker}...")
-                    historical_data = await stock_service.get_historical_data(ticker)
-                    analysis = analyzer.analyze_stock(ticker, historical_data)
-                    
-                    # Save to database
-                    signal_record = SignalModel(
-                        ticker=analysis["ticker"],
-                        signal_type=analysis["signal"],
-                        score=analysis["score"],
-                        price=analysis["price"],
-                        reason=analysis["reason"],
-                        indicators=json.dumps(analysis.get("indicators", {}))
-                    )
-                    db.add(signal_record)
-                    
-                    signals.append(Signal(**analysis))
-                    logger.info(f"Generated signal for {ticker}: {analysis['signal']}")
-                    
-                except Exception as e:
-                    logger.error(f"Error analyzing {ticker}: {e}")
-                    continue
-            
-            db.commit()
+            # the fetches are independent, so let their round-trips overlap
+            results = await asyncio.gather(
+                *[_analyze_one(stock_service, analyzer, t) for t in popular_tickers]
+            )
+            analyses = [a for a in results if a is not None]
+
+            records = [
+                dict(
+                    ticker=analysis["ticker"],
+                    signal_type=analysis["signal"],
+                    score=analysis["score"],
+                    price=analysis["price"],
+                    reason=analysis["reason"],
+                    indicators=_dumps(analysis.get("indicators", {}))
+                )
+                for analysis in analyses
+            ]
+            signals = [Signal(**analysis) for analysis in analyses]
+            if records:
+                # one multi-row INSERT; nothing reads these rows back here
+                await db.execute(insert(SignalModel), records)
+                await db.commit()
+            # refresh per-ticker entries so they match the rows just stored
+            for sig in signals:
+                await _cache_signal(redis, sig)
             logger.info(f"Generated {len(signals)} fresh signals")
         
         return signals
@@ -114,30 +172,44 @@ async def get_top_signals(db: Session = Depends(get_db)):
 
 
 @router.get("/signals/{ticker}", response_model=Signal)
-async def get_signal(ticker: str, db: Session = Depends(get_db)):
+async def get_signal(
+    ticker: str, db: AsyncSession = Depends(get_async_db), redis=Depends(get_redis)
+):
     """Get signal for specific ticker."""
     ticker = ticker.upper()
     logger.info(f"Fetching signal for {ticker}")
     
     try:
+        cached = await _cached_signal(redis, ticker)
+        if cached is not None:
+            return cached
+
         # Check for recent signal in database
-        recent_signal = db.query(SignalModel).filter(
-            SignalModel.ticker == ticker,
-            SignalModel.is_active == True
-        ).order_by(SignalModel.created_at.desc()).first()
+        recent_signal = (
+            await db.execute(
+                select(SignalModel)
+                .where(SignalModel.ticker == ticker, SignalModel.is_active == True)
+                .order_by(SignalModel.created_at.desc())
+                .limit(1)
+            )
+        ).scalars().first()
         
         # If signal is less than 1 hour old, return it
         if recent_signal:
             from datetime import datetime, timedelta
-            if recent_signal.created_at > datetime.now() - timedelta(hours=1):
+            age = datetime.now() - recent_signal.created_at
+            if age < timedelta(hours=1):
                 logger.info(f"Returning cached signal for {ticker}")
-                return Signal(
+                sig = Signal(
                     ticker=recent_signal.ticker,
                     signal=recent_signal.signal_type,
                     score=recent_signal.score,
                     price=recent_signal.price,
                     reason=recent_signal.reason or "Technical analysis"
                 )
+                # cache only for the rest of the row's hour
+                await _cache_signal(redis, sig, SIGNAL_CACHE_TTL - int(age.total_seconds()))
+                return sig
         
         # Generate fresh signal
         logger.info(f"Generating fresh signal for {ticker}")
@@ -154,13 +226,15 @@ async def get_signal(ticker: str, db: Session = Depends(get_db)):
                 score=analysis["score"],
                 price=analysis["price"],
                 reason=analysis["reason"],
-                indicators=json.dumps(analysis.get("indicators", {}))
+                indicators=_dumps(analysis.get("indicators", {}))
             )
             db.add(signal_record)
-            db.commit()
+            await db.commit()
             
             logger.info(f"Generated fresh signal for {ticker}: {analysis['signal']}")
-            return Signal(**analysis)
+            sig = Signal(**analysis)
+            await _cache_signal(redis, sig)
+            return sig
             
     except Exception as e:
         logger.error(f"Error getting signal for {ticker}: {e}")
@@ -14,11 +14,27 @@ instance.
 
 from __future__ import annotations
 
+import math
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Iterable
+from functools import lru_cache
+from statistics import fmean, pstdev
+from typing import Any, Dict, Iterable, List, Tuple
 
+import numpy as np
 import pandas as pd
 
+try:  # optional columnar engine for large universes
+    import polars as pl
+except ImportError:  # pragma: no cover - polars is optional
+    pl = None
+
+FACTORS = ("quality", "value", "momentum")
+REQUIRED_COLUMNS = {"ticker", "sector", *FACTORS}
+
+# Below this size the pandas/polars conversion costs more than it saves.
+POLARS_MIN_ROWS = 5000
+
 
 @dataclass
 class QVMWeights:
@@ -39,6 +55,60 @@ class QVMWeights:
         )
 
 
+@lru_cache(maxsize=64)
+def _sector_plan(sectors: Tuple[Any, ...]) -> Tuple[np.ndarray, ...]:
+    """Return ``(sorted_codes, order, starts, counts)`` for a sector layout.
+
+    Screens are re-run on the same universe with fresh factor values, so the
+    sort and group boundaries are cached per sector tuple and only the
+    reductions are redone.  The arrays are shared and marked read-only.
+    """
+
+    codes = pd.Categorical(list(sectors)).codes
+    order = np.argsort(codes, kind="stable")
+    s = codes[order]
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(s)) + 1))
+    counts = np.diff(np.append(starts, len(s)))
+    plan = (s, order, starts, counts)
+    for arr in plan:
+        arr.setflags(write=False)
+    return plan
+
+
+def _sector_zscore(values: np.ndarray, plan: Tuple[np.ndarray, ...]) -> np.ndarray:
+    """Column-wise z-scores of ``values`` within each sector of ``plan``.
+
+    Rows are sorted once by sector so each statistic is a single
+    ``np.add.reduceat`` over contiguous runs.  NaN values are skipped like
+    pandas does, rows with a missing sector (code ``-1``) get NaN, and
+    zero-variance groups get NaN rather than dividing by zero.
+    """
+
+    if len(values) == 0:
+        return np.empty_like(values, dtype=np.float64)
+    s, order, starts, counts = plan
+    v = values[order]
+
+    valid = ~np.isnan(v)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        n = np.add.reduceat(valid, starts, axis=0)
+        # shift by a member of each group so constant groups come out
+        # exactly zero instead of carrying rounding error from the mean
+        shift = np.repeat(np.fmin.reduceat(v, starts, axis=0), counts, axis=0)
+        d = v - shift
+        mean = np.add.reduceat(np.where(valid, d, 0.0), starts, axis=0) / n
+        dev = d - np.repeat(mean, counts, axis=0)
+        var = np.add.reduceat(np.where(valid, dev * dev, 0.0), starts, axis=0) / n
+        std = np.sqrt(var)
+        std[std == 0] = np.nan
+        z = dev / np.repeat(std, counts, axis=0)
+    z[s < 0] = np.nan
+
+    out = np.empty_like(z)
+    out[order] = z
+    return out
+
+
 def _zscore_grouped(df: pd.DataFrame, cols: Iterable[str], group_col: str) -> pd.DataFrame:
     """Return z‑scores for ``cols`` grouped by ``group_col``.
 
@@ -46,9 +116,50 @@ def _zscore_grouped(df: pd.DataFrame, cols: Iterable[str], group_col: str) -> pd
     division by zero errors when a group has only a single member.
     """
 
-    return df.groupby(group_col)[list(cols)].transform(
-        lambda s: (s - s.mean()) / s.std(ddof=0)
+    cols = list(cols)
+    plan = _sector_plan(tuple(df[group_col]))
+    z = _sector_zscore(df[cols].to_numpy(dtype=np.float64), plan)
+    return pd.DataFrame(z, index=df.index, columns=cols)
+
+
+def _compute_qvm_polars(
+    df: pd.DataFrame, weights: QVMWeights, group_col: str
+) -> pd.DataFrame:
+    """Polars version of :func:`compute_qvm_scores` for large frames.
+
+    The three sector z-scores are independent expressions, so polars
+    evaluates them in parallel.
+    """
+
+    def _z(c: str) -> "pl.Expr":
+        # shift by the group minimum as _sector_zscore does, so constant
+        # sectors have an exactly zero std and get null instead of ±inf
+        d = pl.col(c) - pl.col(c).min().over(group_col)
+        std = d.std(ddof=0).over(group_col)
+        return (
+            pl.when(std > 0)
+            .then((d - d.mean().over(group_col)) / std)
+            .otherwise(None)
+            .fill_nan(None)
+            .alias(f"{c}_z")
+        )
+
+    zscores = [_z(c) for c in FACTORS]
+    # missing z-scores count as zero, like pandas' skipna sum
+    composite = (
+        weights.quality * pl.col("quality_z").fill_null(0.0)
+        + weights.value * pl.col("value_z").fill_null(0.0)
+        + weights.momentum * pl.col("momentum_z").fill_null(0.0)
+    ).alias("qvm_score")
+    result = (
+        pl.from_pandas(df)
+        .lazy()
+        .with_columns(zscores)
+        .with_columns(composite)
+        .sort("qvm_score", descending=True, nulls_last=True)
+        .collect()
     )
+    return result.to_pandas()
 
 
 def compute_qvm_scores(
@@ -75,18 +186,63 @@ def compute_qvm_scores(
         in descending order.
     """
 
-    required = {"ticker", "sector", "quality", "value", "momentum"}
-    missing = required - set(df.columns)
+    missing = REQUIRED_COLUMNS - set(df.columns)
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
 
     weights = weights or QVMWeights()
-    zscores = _zscore_grouped(df, ["quality", "value", "momentum"], group_col)
+    if pl is not None and len(df) >= POLARS_MIN_ROWS:
+        return _compute_qvm_polars(df, weights, group_col)
+
+    zscores = _zscore_grouped(df, FACTORS, group_col)
 
-    composite = (zscores * weights.to_series()).sum(axis=1)
+    w = np.array([weights.quality, weights.value, weights.momentum], dtype=np.float64)
+    # NaN z-scores (zero-variance sectors) contribute nothing to the blend
+    composite = np.nan_to_num(zscores[list(FACTORS)].to_numpy(dtype=np.float64)) @ w
 
     result = df.copy()
     result[["quality_z", "value_z", "momentum_z"]] = zscores
     result["qvm_score"] = composite
 
     return result.sort_values("qvm_score", ascending=False).reset_index(drop=True)
+
+
+def compute_qvm_scores_records(
+    items: List[Dict[str, Any]],
+    weights: QVMWeights | None = None,
+    group_col: str = "sector",
+) -> List[Dict[str, Any]]:
+    """Dict-in, dict-out version of :func:`compute_qvm_scores`.
+
+    For a few hundred tickers, building and tearing down DataFrames costs
+    more than the arithmetic, so this works on plain lists.  Returns new
+    dicts with the ``*_z`` and ``qvm_score`` keys added, best score first.
+    """
+
+    for item in items:
+        missing = REQUIRED_COLUMNS - item.keys()
+        if missing:
+            raise ValueError(f"Missing required columns: {missing}")
+
+    weights = weights or QVMWeights()
+    blend = (weights.quality, weights.value, weights.momentum)
+    groups: Dict[Any, List[int]] = defaultdict(list)
+    for i, item in enumerate(items):
+        groups[item[group_col]].append(i)
+
+    rows = [dict(item) for item in items]
+    for members in groups.values():
+        for col in FACTORS:
+            vals = [items[i][col] for i in members]
+            mu = fmean(vals)
+            sd = pstdev(vals, mu)
+            for i, v in zip(members, vals):
+                rows[i][f"{col}_z"] = (v - mu) / sd if sd else math.nan
+
+    for row in rows:
+        # NaN z-scores count as zero, like the pandas skipna sum
+        row["qvm_score"] = sum(
+            w * z for w, z in zip(blend, (row[f"{c}_z"] for c in FACTORS)) if z == z
+        )
+    rows.sort(key=lambda r: r["qvm_score"], reverse=True)
+    return rows
@@ -1,8 +1,13 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import os
 
-app = FastAPI(title="Stock Recommender API", version="1.0.0")
+app = FastAPI(
+    title="Stock Recommender API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # CORS middleware
 app.add_middleware(
@@ -13,6 +18,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def connect_redis():
+    # optional hot-path cache for per-ticker signals
+    url = os.getenv("REDIS_URL")
+    app.state.redis = None
+    if url:
+        from redis import asyncio as aioredis
+
+        app.state.redis = aioredis.from_url(url)
+
+
+@app.on_event("shutdown")
+async def close_redis():
+    if app.state.redis is not None:
+        await app.state.redis.close()
+
+
 @app.get("/")
 async def root():
     return {"message": "Stock Recommender API"}
@@ -5,20 +5,41 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 import datetime as dt
 
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pa_csv
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pa = None
+
 from signals import (
     Config,
-    analyze_ticker,
-    compute_core_indicators,
+    compute_all,
+    compute_all_gated,
     compute_buy_timing,
     pick_strategies,
 )
+from signals.analysis import fetch_history, fetch_history_batch
 from signals.sell_decision import Position, PositionType, SellConfig, decide_sell
 
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+except ImportError:  # pragma: no cover - orjson is optional
+    def _dumps(obj) -> str:
+        return json.dumps(obj, default=str)
+
+
+REC_ORDER = ["BUY", "SELL", "HOLD"]
+
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="AI Signal Bot (free data via yfinance)")
@@ -27,11 +48,17 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--min-price", type=float, default=5.0)
     p.add_argument("--min-dollar-vol", type=float, default=5_000_000)
     p.add_argument("--output", type=str, default="")
+    p.add_argument("--workers", type=int, default=8, help="Concurrent yfinance fetches")
     p.add_argument("--include-timing", dest="include_timing", action="store_true", default=True)
     p.add_argument("--no-include-timing", dest="include_timing", action="store_false")
     p.add_argument("--include-options", dest="include_options", action="store_true", default=True)
     p.add_argument("--no-include-options", dest="include_options", action="store_false")
     p.add_argument("--legacy-output", action="store_true", help="Hide new columns for backward compatibility")
+    p.add_argument(
+        "--skip-filtered",
+        action="store_true",
+        help="Omit tickers failing the price/liquidity filters instead of listing them as HOLD",
+    )
     p.add_argument("--sell-decision", action="store_true", help="Run sell decision engine")
     p.add_argument("--ticker", type=str, default="")
     p.add_argument("--type", type=str, default="")
@@ -46,16 +73,92 @@ def parse_args() -> argparse.Namespace:
 
 
 def load_universe(args: argparse.Namespace) -> List[str]:
-    tickers: List[str] = []
-    if args.tickers:
-        tickers += [t.strip().upper() for t in args.tickers.split(",") if t.strip()]
+    raw: List[str] = args.tickers.split(",") if args.tickers else []
     if args.tickers_file:
         with open(args.tickers_file, "r") as f:
-            for line in f:
-                sym = line.strip().upper()
-                if sym:
-                    tickers.append(sym)
-    return sorted(list(set(tickers)))
+            raw.extend(f.read().splitlines())
+    return sorted({t.strip().upper() for t in raw if t.strip()})
+
+
+def _fetch_all(
+    universe: List[str], workers: int
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, str]]:
+    """Fetch every history up front; returns ``(frames, errors)``.
+
+    One batched download covers the universe; tickers it returned no rows
+    for are fetched individually on a thread pool so the round-trips overlap.
+    """
+    try:
+        frames = fetch_history_batch(universe)
+    except Exception:
+        frames = {}
+    # the batch maps tickers it could not download to an empty frame
+    missing = [t for t in universe if t not in frames or frames[t].empty]
+    errors: Dict[str, str] = {}
+
+    def fetch(t: str) -> None:
+        try:
+            frames[t] = fetch_history(t)
+        except Exception as exc:
+            errors[t] = str(exc)
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+            list(ex.map(fetch, missing))
+    return frames, errors
+
+
+def _process_ticker(
+    t: str, df: Optional[pd.DataFrame], args: argparse.Namespace, cfg: Config
+) -> Optional[Dict]:
+    """Build the output row for *t*; errors are captured in the row.
+
+    Returns ``None`` for filtered tickers when ``--skip-filtered`` is set.
+    """
+    try:
+        if args.skip_filtered:
+            res = compute_all_gated(t, args.min_price, args.min_dollar_vol, df=df)
+            if res is None:
+                return None
+            ind, row = res
+        else:
+            ind, row = compute_all(t, args.min_price, args.min_dollar_vol, df=df)
+        if args.include_timing or args.include_options:
+            timing = compute_buy_timing(ind, cfg)
+            if args.include_timing:
+                row["BuySignal"] = timing["buy_signal"]
+                row["TimingNote"] = timing["timing_note"]
+                row["NoBuyReason"] = timing.get("no_buy_reason")
+            if args.include_options:
+                strategies = pick_strategies(
+                    ind["price"], None, 0, cfg, timing["buy_signal"]
+                )
+                row["OptionStrategiesJSON"] = _dumps(strategies)
+        return row
+    except Exception as exc:
+        return {"Ticker": t, "Error": str(exc)}
+
+
+def _write_csv(df: pd.DataFrame, path: str) -> None:
+    """Write *df* with Arrow's C++ CSV writer, falling back to pandas.
+
+    Booleans are written as ``True``/``False`` like ``DataFrame.to_csv``;
+    unlike pandas, Arrow quotes the header and every string field (these
+    included) and writes whole floats without a trailing ``.0``.
+    """
+    if pa is not None:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            for i, field in enumerate(table.schema):
+                if pa.types.is_boolean(field.type):
+                    col = pc.if_else(table.column(i), "True", "False")
+                    table = table.set_column(i, field.name, col)
+            opts = pa_csv.WriteOptions(quoting_style="needed")
+            pa_csv.write_csv(table, path, write_options=opts)
+            return
+        except pa.ArrowException:
+            pass
+    df.to_csv(path, index=False)
 
 
 def main() -> None:
@@ -78,7 +181,7 @@ def main() -> None:
         )
         cfg = SellConfig()
         decision = decide_sell(pos, cfg, prev_peak=args.peak)
-        print(json.dumps(decision, default=str))
+        print(_dumps(decision))
         return
 
     universe = load_universe(args)
@@ -87,25 +190,13 @@ def main() -> None:
         sys.exit(1)
 
     cfg = Config()
-    rows: List[Dict] = []
-    for t in universe:
-        try:
-            row = analyze_ticker(t, args.min_price, args.min_dollar_vol)
-            if args.include_timing or args.include_options:
-                ind = compute_core_indicators(t)
-                timing = compute_buy_timing(ind, cfg)
-                if args.include_timing:
-                    row["BuySignal"] = timing["buy_signal"]
-                    row["TimingNote"] = timing["timing_note"]
-                    row["NoBuyReason"] = timing.get("no_buy_reason")
-                if args.include_options:
-                    strategies = pick_strategies(
-                        ind["price"], None, 0, cfg, timing["buy_signal"]
-                    )
-                    row["OptionStrategiesJSON"] = json.dumps(strategies)
-            rows.append(row)
-        except Exception as exc:
-            rows.append({"Ticker": t, "Error": str(exc)})
+    frames, errors = _fetch_all(universe, args.workers)
+    # the remaining work is CPU-bound, so threads would only contend for the GIL
+    rows: List[Dict] = [
+        {"Ticker": t, "Error": errors[t]} if t in errors else _process_ticker(t, frames[t], args, cfg)
+        for t in universe
+    ]
+    rows = [r for r in rows if r is not None]
 
     df = pd.DataFrame(rows)
     base_cols = [
@@ -135,14 +226,22 @@ def main() -> None:
             df[c] = None
     df = df[cols]
 
-    rec_order = {"BUY": 0, "SELL": 1, "HOLD": 2}
-    df["rec_rank"] = df["Recommendation"].map(rec_order).fillna(3)
-    df["rsi_rank"] = df["RSI14"].fillna(100)
-    df = df.sort_values(by=["rec_rank", "rsi_rank"], ascending=[True, True]).drop(columns=["rec_rank", "rsi_rank"])
+    # sort on categorical codes so no rank columns are materialised;
+    # error rows have no recommendation and land last
+    df = df.sort_values(
+        ["Recommendation", "RSI14"],
+        key=lambda col: (
+            pd.Categorical(col, categories=REC_ORDER, ordered=True)
+            if col.name == "Recommendation"
+            else col.astype(float)
+        ),
+        na_position="last",
+        kind="stable",
+    )
 
     print(df.to_string(index=False))
     if args.output:
-        df.to_csv(args.output, index=False)
+        _write_csv(df, args.output)
         print(f"\nSaved to {args.output}")
 
 
@@ -1,13 +1,17 @@
 """Signal analysis package."""
 from .config import Config
-from .analysis import analyze_ticker, compute_core_indicators
-from .timing import compute_buy_timing
+from .analysis import analyze_ticker, compute_all, compute_all_gated, compute_core_indicators
+from .timing import compute_buy_timing, compute_buy_timing_batch, compute_buy_timing_bool
 from .options import pick_strategies
 
 __all__ = [
     "Config",
     "analyze_ticker",
+    "compute_all",
+    "compute_all_gated",
     "compute_core_indicators",
     "compute_buy_timing",
+    "compute_buy_timing_batch",
+    "compute_buy_timing_bool",
     "pick_strategies",
 ]
@@ -0,0 +1,166 @@
+"""Compiled kernels that return only the latest value of an indicator.
+
+Snapshot callers read a single bar, so these walk the input once and keep
+the recurrences in scalars instead of allocating full-length outputs.
+Results match the last element of the array kernels in
+:mod:`signals.indicators`.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+from ._njit import njit, precompile, NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def sma_last(x: np.ndarray, n: int) -> float:
+    m = x.shape[0]
+    if m < n:
+        return np.nan
+    s = 0.0
+    for i in range(m - n, m):
+        s += x[i]
+    return s / n
+
+
+@njit(cache=True)
+def rsi_last(x: np.ndarray, n: int) -> float:
+    m = x.shape[0]
+    if m <= n:
+        return np.nan
+    alpha = 1.0 / n
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, m):
+        d = x[i] - x[i - 1]
+        gain = d if d > 0 else 0.0
+        loss = -d if d < 0 else 0.0
+        if i == 1:
+            avg_gain = gain
+            avg_loss = loss
+        else:
+            avg_gain = alpha * gain + (1.0 - alpha) * avg_gain
+            avg_loss = alpha * loss + (1.0 - alpha) * avg_loss
+    if avg_loss > 0:
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    if avg_gain > 0:
+        return 100.0
+    return np.nan
+
+
+@njit(cache=True)
+def _ewm_step(ema: float, x: float, alpha: float, skipped: int) -> float:
+    """Next ``ewm(alpha=alpha, adjust=False)`` value for a valid *x*.
+
+    *skipped* counts the NaN bars since the previous observation; like
+    pandas, their decay still applies to the old value's weight.  A NaN
+    *ema* means *x* is the first observation.
+    """
+    if ema != ema:
+        return x
+    if skipped == 0:
+        return alpha * x + (1.0 - alpha) * ema
+    w = (1.0 - alpha) ** (skipped + 1)
+    return (w * ema + alpha * x) / (w + alpha)
+
+
+@njit(cache=True)
+def _macd_last_njit(x: np.ndarray, fast: int, slow: int, signal: int) -> Tuple[float, float]:
+    a_fast = 2.0 / (fast + 1)
+    a_slow = 2.0 / (slow + 1)
+    a_sig = 2.0 / (signal + 1)
+    ema_fast = np.nan
+    ema_slow = np.nan
+    line = np.nan
+    sig = np.nan
+    skipped = 0
+    for i in range(x.shape[0]):
+        # NaN closes hold both EMAs, as ewm(adjust=False) does
+        if x[i] == x[i]:
+            ema_fast = _ewm_step(ema_fast, x[i], a_fast, skipped)
+            ema_slow = _ewm_step(ema_slow, x[i], a_slow, skipped)
+            skipped = 0
+        elif ema_fast == ema_fast:
+            skipped += 1
+        line = ema_fast - ema_slow
+        if line == line:
+            sig = _ewm_step(sig, line, a_sig, 0)
+    return line, sig
+
+
+def _ema_matrix(n: int, alpha: float) -> np.ndarray:
+    """Lower-triangular ``W`` with ``W @ x`` equal to the EMA of *x* seeded at ``x[0]``."""
+    lag = np.arange(n)[:, None] - np.arange(n)[None, :]
+    w = np.where(lag >= 0, alpha * (1.0 - alpha) ** np.maximum(lag, 0), 0.0)
+    w[:, 0] = (1.0 - alpha) ** np.arange(n)
+    return w
+
+
+@lru_cache(maxsize=32)
+def _macd_weights(n: int, fast: int, slow: int, signal: int) -> np.ndarray:
+    # The MACD line and its signal EMA are linear in the closes, so their
+    # last values are two dot products with weights that depend only on the
+    # length and spans.
+    diff = _ema_matrix(n, 2.0 / (fast + 1)) - _ema_matrix(n, 2.0 / (slow + 1))
+    sig = _ema_matrix(n, 2.0 / (signal + 1))[-1] @ diff
+    out = np.stack((diff[-1], sig))
+    out.setflags(write=False)
+    return out
+
+
+def _macd_last_dot(x: np.ndarray, fast: int, slow: int, signal: int) -> Tuple[float, float]:
+    """Closed-form :func:`_macd_last_njit` for builds without Numba."""
+    if x.shape[0] == 0:
+        return np.nan, np.nan
+    if np.isnan(x).any():
+        # gaps change the weights, so fall back to the loop
+        return _macd_last_njit(x, fast, slow, signal)
+    line, sig = _macd_weights(x.shape[0], fast, slow, signal) @ x
+    return float(line), float(sig)
+
+
+# history lengths repeat across tickers, so the cached weights replace the
+# interpreted loop when Numba is missing
+macd_last = _macd_last_njit if NUMBA_AVAILABLE else _macd_last_dot
+
+
+@njit(cache=True)
+def atr_last(high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int) -> float:
+    m = close.shape[0]
+    if m < n:
+        return np.nan
+    alpha = 1.0 / n
+    s = high[0] - low[0]
+    for i in range(1, m):
+        tr = high[i] - low[i]
+        # same NaN handling as np.fmax in _true_range and as _atr_njit
+        up = abs(high[i] - close[i - 1])
+        down = abs(low[i] - close[i - 1])
+        if up > tr or tr != tr:
+            tr = up
+        if down > tr or tr != tr:
+            tr = down
+        s = alpha * tr + (1.0 - alpha) * s
+    return s
+
+
+@njit(cache=True)
+def dollar_vol_last(close: np.ndarray, volume: np.ndarray, n: int) -> float:
+    m = close.shape[0]
+    if m < n:
+        return np.nan
+    s = 0.0
+    for i in range(m - n, m):
+        s += close[i] * volume[i]
+    return s / n
+
+
+# compile the float64 signatures used by the snapshot path at import
+precompile(sma_last, "float64({a}, int64)")
+precompile(rsi_last, "float64({a}, int64)")
+precompile(_macd_last_njit, "UniTuple(float64, 2)({a}, int64, int64, int64)")
+precompile(atr_last, "float64({a}, {a}, {a}, int64)")
+precompile(dollar_vol_last, "float64({a}, {a}, int64)")
@@ -0,0 +1,45 @@
+"""Optional Numba ``njit`` decorator with a pure-Python fallback."""
+from __future__ import annotations
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is optional
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for :func:`numba.njit`."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+# Array argument types a precompile template is expanded with: pandas hands
+# out read-only views under copy-on-write, numpy temporaries are writable.
+_ARRAY_TYPES = (
+    "float64[::1]",
+    "Array(float64, 1, 'C', readonly=True)",
+)
+
+
+def precompile(func, template: str) -> None:
+    """Compile *func* now rather than on its first call.
+
+    *template* is a signature string with ``{a}`` standing for each float64
+    array argument; it is compiled once with writable and once with read-only
+    C-contiguous arrays.  With ``cache=True`` this loads the on-disk build at
+    import time, and unlike passing signatures to ``njit`` other argument
+    types still compile lazily.  A no-op without Numba.
+    """
+    # NUMBA_DISABLE_JIT leaves plain functions without ``compile``
+    if NUMBA_AVAILABLE and hasattr(func, "compile"):
+        for array in _ARRAY_TYPES:
+            func.compile(template.format(a=array))
+
+
+__all__ = ["njit", "precompile", "NUMBA_AVAILABLE"]
@@ -1,100 +1,498 @@
 """Indicator computation and core analysis functions."""
 from __future__ import annotations
 
-from typing import Dict, Any
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Callable, Dict, Any, Iterable, Iterator, Optional, Tuple
+import functools
+import hashlib
+import io
 import math
+import os
+import threading
+import time
 
 import numpy as np
+import orjson
 import pandas as pd
 import yfinance as yf
 
-from .indicators import rsi, sma, macd, atr
+from ._kernels import atr_last, dollar_vol_last, macd_last, rsi_last, sma_last
+from .indicators import _macd, _masked_cumsum, _window_mean
 
 
+HISTORY_CACHE_DIR = Path(os.getenv("HISTORY_CACHE_DIR", "cache"))
+# Daily bars keep updating during the session, so cap the TTL well below the
+# bar length to keep the latest close fresh.
+HISTORY_CACHE_MAX_TTL = int(os.getenv("HISTORY_CACHE_MAX_TTL", "900"))
+_INTERVAL_SECONDS = {
+    "1m": 60, "2m": 120, "5m": 300, "15m": 900, "30m": 1800,
+    "60m": 3600, "90m": 5400, "1h": 3600, "1d": 86400,
+}
+
+# Parsed frames kept in process so warm hits skip the parquet read.
+HISTORY_MEMORY_SIZE = int(os.getenv("HISTORY_MEMORY_SIZE", "2048"))
+_memory: Dict[Tuple[str, str, str], Tuple[float, pd.DataFrame]] = {}
+_memory_lock = threading.Lock()
+
+# Each shared_history() block owns its memo, so overlapping monitor runs
+# never clear each other's; worker threads need a copy of the caller's context.
+_cycle_cache: ContextVar[Optional[Dict[Tuple[str, str, str], pd.DataFrame]]] = ContextVar(
+    "_cycle_cache", default=None
+)
+_cycle_lock = threading.Lock()
+
+# Indicator snapshots per ticker; entries also expire at the next bar close
+# so a cached value never straddles a 5-minute boundary.
+INDICATOR_CACHE_TTL = int(os.getenv("INDICATOR_CACHE_TTL", "60"))
+INDICATOR_CACHE_SIZE = 1024
+_BAR_SECONDS = 300
+_indicators: Dict[str, Tuple[float, Dict[str, float]]] = {}
+_indicators_lock = threading.Lock()
+_indicator_stats = {"hits": 0, "misses": 0}
+
+_CHART_URL = "https://query2.finance.yahoo.com/v8/finance/chart/{ticker}"
+
+# One keep-alive session for every Yahoo call, so TLS handshakes and the
+# cookie/crumb exchange happen once per process rather than per ticker.
+try:  # Yahoo rejects plain requests sessions; yfinance ships curl_cffi
+    from curl_cffi import requests as _http
+
+    _SESSION = _http.Session(impersonate="chrome")
+except ImportError:  # pragma: no cover - older yfinance
+    import requests as _http
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    _SESSION = _http.Session()
+    _SESSION.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.2),
+        ),
+    )
+
+_redis = None
+
+
+def _redis_client():
+    """Return a Redis client when ``REDIS_URL`` is set and redis is installed."""
+    global _redis
+    if _redis is None:
+        url = os.getenv("REDIS_URL")
+        try:
+            import redis
+
+            _redis = redis.Redis.from_url(url) if url else False
+        except ImportError:
+            _redis = False
+    return _redis or None
+
+
+@contextmanager
+def shared_history() -> Iterator[None]:
+    """Reuse fetched histories in memory for the duration of the block."""
+    token = _cycle_cache.set({})
+    try:
+        yield
+    finally:
+        _cycle_cache.reset(token)
+
+
+def _ttl(interval: str) -> int:
+    return min(_INTERVAL_SECONDS.get(interval, 0), HISTORY_CACHE_MAX_TTL)
+
+
+def _digest(key: Tuple[str, str, str]) -> str:
+    return hashlib.sha1("|".join(key).encode()).hexdigest()
+
+
+def _cache_get(key: Tuple[str, str, str]) -> Optional[pd.DataFrame]:
+    """Look *key* up in the cycle memo, memory, parquet and Redis, in order."""
+    memo = _cycle_cache.get()
+    if memo is not None:
+        with _cycle_lock:
+            if key in memo:
+                return memo[key]
+
+    ttl = _ttl(key[2])
+    if ttl <= 0:
+        return None
+    now = time.time()
+    with _memory_lock:
+        hit = _memory.get(key)
+    if hit is not None and hit[0] > now:
+        df = hit[1]
+    else:
+        df = None
+        digest = _digest(key)
+        path = HISTORY_CACHE_DIR / f"{digest}.parquet"
+        try:
+            if now - path.stat().st_mtime < ttl:
+                df = pd.read_parquet(path)
+        except (OSError, ImportError, ValueError):
+            df = None
+        if df is None and _redis_client() is not None:
+            try:
+                blob = _redis_client().get(f"history:{digest}")
+                if blob:
+                    df = pd.read_parquet(io.BytesIO(blob))
+            except Exception:
+                df = None
+        if df is None:
+            return None
+        _remember(key, df, now + ttl)
+
+    if memo is not None:
+        with _cycle_lock:
+            memo[key] = df
+    return df
+
+
+def _cache_put(key: Tuple[str, str, str], df: pd.DataFrame) -> None:
+    """Store a freshly fetched frame in every cache layer."""
+    memo = _cycle_cache.get()
+    if memo is not None:
+        with _cycle_lock:
+            memo[key] = df
+    ttl = _ttl(key[2])
+    if ttl <= 0 or df.empty:
+        return
+    _remember(key, df, time.time() + ttl)
+    digest = _digest(key)
+    try:
+        HISTORY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(HISTORY_CACHE_DIR / f"{digest}.parquet")
+    except (OSError, ImportError, ValueError):
+        pass
+    if _redis_client() is not None:
+        try:
+            _redis_client().set(f"history:{digest}", df.to_parquet(), ex=ttl)
+        except Exception:
+            pass
+
+
+def _cached_history(func: Callable[..., pd.DataFrame]) -> Callable[..., pd.DataFrame]:
+    """Cache history in memory, on disk as parquet and optionally in Redis.
+
+    All layers share a TTL tied to the bar interval.
+    """
+
+    @functools.wraps(func)
+    def wrapper(ticker: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
+        key = (ticker, period, interval)
+        df = _cache_get(key)
+        if df is None:
+            df = func(ticker, period, interval)
+            _cache_put(key, df)
+        return df
+
+    return wrapper
+
+
+def _remember(key: Tuple[str, str, str], df: pd.DataFrame, expires: float) -> None:
+    with _memory_lock:
+        _memory.pop(key, None)
+        _memory[key] = (expires, df)
+        # dicts keep insertion order, so the first entry is the oldest
+        while len(_memory) > HISTORY_MEMORY_SIZE:
+            del _memory[next(iter(_memory))]
+
+
+@_cached_history
 def fetch_history(ticker: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
     """Fetch OHLCV history from yfinance."""
-    df = yf.Ticker(ticker).history(period=period, interval=interval, auto_adjust=False)
+    # nothing reads dividends or splits, so skip building those columns;
+    # this also matches the frames fetch_history_batch caches
+    df = yf.Ticker(ticker, session=_SESSION).history(
+        period=period, interval=interval, auto_adjust=False, actions=False
+    )
     if df.empty:
         return df
     return df
 
 
-def compute_core_indicators(ticker: str) -> Dict[str, float]:
-    """Compute core indicator set for *ticker*."""
-    df = fetch_history(ticker)
+def fetch_earnings_dates(ticker: str, limit: int = 1) -> pd.DataFrame:
+    """Fetch earnings dates, cached in the same layers as price history.
+
+    The scrape behind ``get_earnings_dates`` is slow and the answer changes
+    at most daily, so repeat lookups are served from memory, parquet or Redis.
+    """
+    key = (ticker, f"earnings:{limit}", "1d")
+    df = _cache_get(key)
+    if df is None:
+        df = yf.Ticker(ticker, session=_SESSION).get_earnings_dates(limit=limit)
+        if df is None:
+            df = pd.DataFrame()
+        _cache_put(key, df)
+    return df
+
+
+def fetch_history_arrow(ticker: str, period: str = "1y", interval: str = "1d"):
+    """Fetch OHLCV history from Yahoo's chart API straight into polars.
+
+    Bypasses yfinance's pandas frame construction: the JSON is parsed with
+    orjson and each column becomes a typed Arrow buffer.  Returns a
+    ``polars.DataFrame`` with ``Date``, ``Open``, ``High``, ``Low``,
+    ``Close``, ``Adj Close`` and ``Volume``; ``Series.to_numpy()`` hands the
+    float columns to the indicator kernels without copying.
+    """
+    import polars as pl
+
+    resp = _SESSION.get(
+        _CHART_URL.format(ticker=ticker),
+        params={"range": period, "interval": interval},
+        timeout=10,
+    )
+    resp.raise_for_status()
+    chart = orjson.loads(resp.content)["chart"]
+    if chart.get("error"):
+        raise ValueError(chart["error"].get("description") or str(chart["error"]))
+    result = chart["result"][0]
+    quote = result["indicators"]["quote"][0]
+    adj = result["indicators"].get("adjclose", [{}])[0].get("adjclose", quote["close"])
+    return pl.DataFrame(
+        {
+            "Date": pl.from_epoch(pl.Series(result.get("timestamp", []), dtype=pl.Int64), time_unit="s"),
+            "Open": pl.Series(quote["open"], dtype=pl.Float64),
+            "High": pl.Series(quote["high"], dtype=pl.Float64),
+            "Low": pl.Series(quote["low"], dtype=pl.Float64),
+            "Close": pl.Series(quote["close"], dtype=pl.Float64),
+            "Adj Close": pl.Series(adj, dtype=pl.Float64),
+            "Volume": pl.Series(quote["volume"], dtype=pl.Float64),
+        }
+    ).drop_nulls("Close")
+
+
+def fetch_history_batch(
+    tickers: Iterable[str], period: str = "1y", interval: str = "1d"
+) -> Dict[str, pd.DataFrame]:
+    """Fetch OHLCV history for many tickers with a single ``yf.download``.
+
+    Tickers already in the history cache are served from it; only the rest
+    are downloaded, and their frames are cached for :func:`fetch_history`.
+    """
+    frames: Dict[str, pd.DataFrame] = {}
+    pending = []
+    for t in dict.fromkeys(tickers):
+        cached = _cache_get((t, period, interval))
+        if cached is None:
+            pending.append(t)
+        else:
+            frames[t] = cached
+    if not pending:
+        return frames
+    data = yf.download(
+        pending,
+        period=period,
+        interval=interval,
+        group_by="ticker",
+        threads=True,
+        auto_adjust=False,
+        progress=False,
+        session=_SESSION,
+    )
+    multi = isinstance(data.columns, pd.MultiIndex)
+    for t in pending:
+        if multi:
+            if t not in data.columns.get_level_values(0):
+                frames[t] = pd.DataFrame()
+                continue
+            df = data[t]
+        else:
+            df = data
+        frames[t] = df.dropna(how="all")
+        _cache_put((t, period, interval), frames[t])
+    return frames
+
+
+def indicator_cache_stats() -> Dict[str, int]:
+    """Return hit/miss counters and the size of the indicator cache."""
+    with _indicators_lock:
+        return {**_indicator_stats, "size": len(_indicators)}
+
+
+def compute_core_indicators(ticker: str, df: Optional[pd.DataFrame] = None) -> Dict[str, float]:
+    """Compute core indicator set for *ticker*.
+
+    *df* may carry already-fetched history; otherwise it is downloaded and
+    the result is cached for ``INDICATOR_CACHE_TTL`` seconds.
+    """
+    if df is not None:
+        return _core_indicators(df)
+    now = time.time()
+    with _indicators_lock:
+        hit = _indicators.get(ticker)
+        if hit is not None and hit[0] > now:
+            _indicator_stats["hits"] += 1
+            return dict(hit[1])
+        _indicator_stats["misses"] += 1
+    ind = _core_indicators(fetch_history(ticker))
+    expires = min(now + INDICATOR_CACHE_TTL, (now // _BAR_SECONDS + 1) * _BAR_SECONDS)
+    with _indicators_lock:
+        _indicators.pop(ticker, None)
+        _indicators[ticker] = (expires, ind)
+        while len(_indicators) > INDICATOR_CACHE_SIZE:
+            del _indicators[next(iter(_indicators))]
+    return dict(ind)
+
+
+def _core_indicators(df: pd.DataFrame) -> Dict[str, float]:
     if df.empty or len(df) < 60:
         raise ValueError("No/insufficient data")
-    close = df["Close"]
-    price = float(close.iloc[-1])
-    indicators = {
-        "price": price,
-        "sma20": float(sma(close, 20).iloc[-1]),
-        "sma50": float(sma(close, 50).iloc[-1]),
-        "sma200": float(sma(close, 200).iloc[-1]),
-        "rsi14": float(rsi(close, 14).iloc[-1]),
+    close = df["Close"].to_numpy(dtype=np.float64)
+    macd_line, macd_signal = macd_last(close, 12, 26, 9)
+    return {
+        "price": float(close[-1]),
+        "sma20": float(sma_last(close, 20)),
+        "sma50": float(sma_last(close, 50)),
+        "sma200": float(sma_last(close, 200)),
+        "rsi14": float(rsi_last(close, 14)),
+        "macd": float(macd_line),
+        "macd_signal": float(macd_signal),
+        "atr14": float(
+            atr_last(
+                df["High"].to_numpy(dtype=np.float64),
+                df["Low"].to_numpy(dtype=np.float64),
+                close,
+                14,
+            )
+        ),
+        "avg_dollar_vol": float(
+            dollar_vol_last(close, df["Volume"].to_numpy(dtype=np.float64), 20)
+        ),
     }
-    macd_line, macd_signal = macd(close, 12, 26, 9)
-    indicators["macd"] = float(macd_line.iloc[-1])
-    indicators["macd_signal"] = float(macd_signal.iloc[-1])
-    indicators["atr14"] = float(atr(df, 14).iloc[-1])
-    dollar_vol = (close * df["Volume"]).rolling(20).mean()
-    indicators["avg_dollar_vol"] = float(dollar_vol.iloc[-1])
-    return indicators
 
 
-def _crossover(series_a: pd.Series, series_b: pd.Series) -> pd.Series:
-    prev = series_a.shift(1) - series_b.shift(1)
-    curr = series_a - series_b
-    return (prev <= 0) & (curr > 0)
+def _sma_tail(cs: np.ndarray, cm: np.ndarray, period: int, count: int = 2) -> np.ndarray:
+    """Return the last *count* SMA values from :func:`_masked_cumsum` arrays."""
+    n = cs.shape[0] - 1
+    return _window_mean(cs, cm, period, np.arange(max(n - count + 1, 0), n + 1))
+
+
+def _nn(x: float) -> Optional[float]:
+    """``float(x)``, or ``None`` for NaN (``x != x`` is the cheapest test)."""
+    return None if x != x else float(x)
 
 
-def _crossunder(series_a: pd.Series, series_b: pd.Series) -> pd.Series:
-    prev = series_a.shift(1) - series_b.shift(1)
-    curr = series_a - series_b
-    return (prev >= 0) & (curr < 0)
+def _crossover_last(a: np.ndarray, b: np.ndarray) -> bool:
+    """True if *a* crossed above *b* on the last bar."""
+    return bool((a[-2] - b[-2] <= 0) and (a[-1] - b[-1] > 0))
 
 
-def analyze_ticker(ticker: str, min_price: float, min_dollar_vol: float) -> Dict[str, Any]:
-    """Analyze *ticker* and produce signal summary for CLI/API."""
-    df = fetch_history(ticker)
+def _crossunder_last(a: np.ndarray, b: np.ndarray) -> bool:
+    """True if *a* crossed below *b* on the last bar."""
+    return bool((a[-2] - b[-2] >= 0) and (a[-1] - b[-1] < 0))
+
+
+def analyze_ticker(
+    ticker: str,
+    min_price: float,
+    min_dollar_vol: float,
+    df: Optional[pd.DataFrame] = None,
+) -> Dict[str, Any]:
+    """Analyze *ticker* and produce signal summary for CLI/API.
+
+    *df* may carry already-fetched history; otherwise it is downloaded.
+    """
+    if df is None:
+        df = fetch_history(ticker)
     if df.empty or len(df) < 60:
         return {"Ticker": ticker, "Error": "No/insufficient data"}
+    return compute_all(ticker, min_price, min_dollar_vol, df=df)[1]
+
+
+def compute_all_gated(
+    ticker: str,
+    min_price: float,
+    min_dollar_vol: float,
+    df: Optional[pd.DataFrame] = None,
+) -> Optional[Tuple[Dict[str, float], Dict[str, Any]]]:
+    """:func:`compute_all` for scans that drop filtered tickers.
+
+    The price and 20-day dollar-volume filters are checked first, from the
+    last closes alone; tickers failing either return ``None`` without any
+    SMA, RSI, MACD or ATR work.
+    """
+    if df is None:
+        df = fetch_history(ticker)
+    if df.empty or len(df) < 60:
+        raise ValueError("No/insufficient data")
+    close = df["Close"].to_numpy(dtype=np.float64)[-20:]
+    volume = df["Volume"].to_numpy(dtype=np.float64)[-20:]
+    # NaN compares false, so missing data fails the gate as in compute_all
+    if not (close[-1] >= min_price and float((close * volume).mean()) >= min_dollar_vol):
+        return None
+    return compute_all(ticker, min_price, min_dollar_vol, df=df)
+
 
-    close = df["Close"]
-    volume = df["Volume"]
-    price = float(close.iloc[-1])
+def compute_all(
+    ticker: str,
+    min_price: float,
+    min_dollar_vol: float,
+    df: Optional[pd.DataFrame] = None,
+) -> Tuple[Dict[str, float], Dict[str, Any]]:
+    """Return ``(indicators, row)`` for *ticker* from one pass over its history.
 
-    sma20 = sma(close, 20)
-    sma50 = sma(close, 50)
-    sma200 = sma(close, 200)
-    rsi14 = rsi(close, 14)
-    macd_line, macd_sig = macd(close, 12, 26, 9)
-    atr14 = atr(df, 14)
+    ``indicators`` matches :func:`compute_core_indicators` and ``row`` matches
+    :func:`analyze_ticker`; each indicator is computed once and shared.
+    Raises ``ValueError`` when history is missing or shorter than 60 bars.
+    """
+    if df is None:
+        df = fetch_history(ticker)
+    if df.empty or len(df) < 60:
+        raise ValueError("No/insufficient data")
+
+    # Only the last two bars are ever read, so work on tails of raw arrays
+    # rather than materialising full-length indicator Series.
+    close = df["Close"].to_numpy(dtype=np.float64)
+    volume = df["Volume"].to_numpy(dtype=np.float64)
+    price = float(close[-1])
 
-    dollar_vol_20 = (close * volume).rolling(20).mean()
-    avg_dollar_vol = float(dollar_vol_20.iloc[-1]) if not dollar_vol_20.isna().iloc[-1] else np.nan
+    cs, cm = _masked_cumsum(close)
+    sma20 = _sma_tail(cs, cm, 20)
+    sma50 = _sma_tail(cs, cm, 50)
+    sma200 = _sma_tail(cs, cm, 200)
+    macd_full, sig_full = _macd(close, 2.0 / (12 + 1), 2.0 / (26 + 1), 2.0 / (9 + 1))
+    macd_line = macd_full[-2:]
+    macd_sig = sig_full[-2:]
+    atr14 = atr_last(
+        df["High"].to_numpy(dtype=np.float64),
+        df["Low"].to_numpy(dtype=np.float64),
+        close,
+        14,
+    )
+
+    avg_dollar_vol = float((close[-20:] * volume[-20:]).mean())
 
     passes_price = price >= min_price
     passes_liquidity = (not math.isnan(avg_dollar_vol)) and (avg_dollar_vol >= min_dollar_vol)
     risk_ok = passes_price and passes_liquidity
 
+    # latest values, read once for the trend filter and the result row
+    s20, s50, s200 = sma20[-1], sma50[-1], sma200[-1]
+    ml, msig = macd_line[-1], macd_sig[-1]
+
     reasons, signals = [], []
-    uptrend = price > (sma200.iloc[-1] if not np.isnan(sma200.iloc[-1]) else -np.inf)
-    downtrend = price < (sma200.iloc[-1] if not np.isnan(sma200.iloc[-1]) else np.inf)
-    rsi_now = float(rsi14.iloc[-1])
+    uptrend = price > (s200 if s200 == s200 else -np.inf)
+    downtrend = price < (s200 if s200 == s200 else np.inf)
+    rsi_now = float(rsi_last(close, 14))
 
     if rsi_now < 30 and uptrend:
         signals.append("BUY"); reasons.append("RSI<30 in uptrend (SMA200)")
     elif rsi_now > 70 and downtrend:
         signals.append("SELL"); reasons.append("RSI>70 in downtrend (SMA200)")
 
-    if _crossover(sma20, sma50).iloc[-1]:
+    if _crossover_last(sma20, sma50):
         signals.append("BUY"); reasons.append("SMA20 crossed above SMA50")
-    if _crossunder(sma20, sma50).iloc[-1]:
+    if _crossunder_last(sma20, sma50):
         signals.append("SELL"); reasons.append("SMA20 crossed below SMA50")
-    if _crossover(macd_line, macd_sig).iloc[-1]:
+    if _crossover_last(macd_line, macd_sig):
         signals.append("BUY"); reasons.append("MACD crossed above signal")
-    if _crossunder(macd_line, macd_sig).iloc[-1]:
+    if _crossunder_last(macd_line, macd_sig):
         signals.append("SELL"); reasons.append("MACD crossed below signal")
 
     buy_votes = signals.count("BUY"); sell_votes = signals.count("SELL")
@@ -113,18 +511,30 @@ def analyze_ticker(ticker: str, min_price: float, min_dollar_vol: float) -> Dict
         if not reasons:
             reasons.append("No strong signals")
 
-    return {
+    indicators = {
+        "price": price,
+        "sma20": float(s20),
+        "sma50": float(s50),
+        "sma200": float(s200),
+        "rsi14": rsi_now,
+        "macd": float(ml),
+        "macd_signal": float(msig),
+        "atr14": float(atr14),
+        "avg_dollar_vol": avg_dollar_vol,
+    }
+    row = {
         "Ticker": ticker,
         "Price": round(price, 4),
         "RSI14": round(rsi_now, 2),
-        "SMA20": float(sma20.iloc[-1]) if not np.isnan(sma20.iloc[-1]) else None,
-        "SMA50": float(sma50.iloc[-1]) if not np.isnan(sma50.iloc[-1]) else None,
-        "SMA200": float(sma200.iloc[-1]) if not np.isnan(sma200.iloc[-1]) else None,
-        "MACD": float(macd_line.iloc[-1]) if not np.isnan(macd_line.iloc[-1]) else None,
-        "MACDSignal": float(macd_sig.iloc[-1]) if not np.isnan(macd_sig.iloc[-1]) else None,
-        "ATR14": float(atr14.iloc[-1]) if not np.isnan(atr14.iloc[-1]) else None,
+        "SMA20": _nn(s20),
+        "SMA50": _nn(s50),
+        "SMA200": _nn(s200),
+        "MACD": _nn(ml),
+        "MACDSignal": _nn(msig),
+        "ATR14": _nn(atr14),
         "AvgDollarVol20D": round(avg_dollar_vol, 2) if not math.isnan(avg_dollar_vol) else None,
         "Signals": ", ".join(signals) if signals else "None",
         "Recommendation": recommendation,
         "Reasons": " | ".join(reasons) if reasons else "None",
     }
+    return indicators, row
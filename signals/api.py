@@ -1,20 +1,32 @@
 """FastAPI endpoints wrapping analysis and strategy logic."""
 from __future__ import annotations
 
-from typing import List, Optional, Dict, Any
-from datetime import date
-
+import asyncio
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence
+from datetime import date, datetime, timezone
+
+import anyio.to_thread
+import numpy as np
+import pandas as pd
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from .config import Config
-from .analysis import compute_core_indicators, analyze_ticker
+from .analysis import (
+    analyze_ticker,
+    compute_all,
+    compute_core_indicators,
+    fetch_history_batch,
+    indicator_cache_stats,
+)
 from .timing import compute_buy_timing
-from .options import pick_strategies
+from .options import _expiry_iso, pick_strategies
 from .sell_decision import PositionType, Position, SellConfig, decide_sell
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -24,6 +36,15 @@ app.add_middleware(
 
 cfg = Config()
 
+# Handlers block on yfinance in anyio worker threads; raise the pool above
+# anyio's default of 40 so a large /batch is not throttled.
+THREAD_LIMIT = 64
+
+
+@app.on_event("startup")
+def _raise_thread_limit() -> None:
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREAD_LIMIT
+
 
 class AnalyzeRequest(BaseModel):
     ticker: str
@@ -52,7 +73,7 @@ class StrategyResp(BaseModel):
     expiry: str
     legs: List[Dict[str, Any]]
     estimates: Dict[str, float]
-    why: List[str]
+    why: Sequence[str]
     disclaimer: str
     precondition: Optional[str] = None
     type: str
@@ -92,6 +113,31 @@ class SellDecisionRequest(BaseModel):
     position: PositionModel
     config: SellConfigModel = SellConfigModel()
     prev_peak: Optional[float] = None
+    # a snapshot from an earlier /sell-decision response; used instead of a
+    # live fetch while its ``as_of`` is within SNAPSHOT_MAX_AGE seconds
+    snapshot: Optional[Dict[str, Any]] = None
+
+
+SNAPSHOT_MAX_AGE = 300
+
+
+def _fresh_snapshot(snap: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Return *snap* if it carries a recent ``as_of`` timestamp, else None."""
+    if not snap or not snap.get("as_of"):
+        return None
+    try:
+        as_of = datetime.fromisoformat(snap["as_of"])
+    except (TypeError, ValueError):
+        return None
+    if as_of.tzinfo is None:
+        as_of = as_of.replace(tzinfo=timezone.utc)
+    age = (datetime.now(timezone.utc) - as_of).total_seconds()
+    return snap if 0 <= age <= SNAPSHOT_MAX_AGE else None
+
+
+# most requests leave the thresholds at their defaults
+_DEFAULT_SELL_CONFIG = SellConfigModel()
+_DEFAULT_SELL_CFG = SellConfig()
 
 
 @app.get("/health")
@@ -99,33 +145,67 @@ def health() -> Dict[str, bool]:
     return {"ok": True}
 
 
-def _analyze_one(req: AnalyzeRequest) -> AnalyzeResponse:
-    ind = compute_core_indicators(req.ticker)
+@app.get("/cache/stats")
+def cache_stats() -> Dict[str, int]:
+    return indicator_cache_stats()
+
+
+def _prefetched(frames: Dict[str, pd.DataFrame], ticker: str) -> Optional[pd.DataFrame]:
+    df = frames.get(ticker)
+    return None if df is None or df.empty else df
+
+
+def _analyze_one(req: AnalyzeRequest, history: Optional[pd.DataFrame] = None) -> AnalyzeResponse:
+    if history is None:
+        ind = compute_core_indicators(req.ticker)
+        base = analyze_ticker(req.ticker, cfg.min_price, cfg.min_avg_dollar_vol)
+    else:
+        ind, base = compute_all(req.ticker, cfg.min_price, cfg.min_avg_dollar_vol, df=history)
     timing = compute_buy_timing(ind, cfg)
-    base = analyze_ticker(req.ticker, cfg.min_price, cfg.min_avg_dollar_vol)
     strategies = pick_strategies(
         ind["price"], req.iv_rank, req.holding_shares, cfg, timing["buy_signal"]
     )
-    signal_obj = {
-        "raw": base.get("Recommendation", "HOLD"),
-        "reasons": base.get("Reasons", "").split(" | ") if base.get("Reasons") else [],
-    }
-    resp_dict = {
-        "ticker": req.ticker,
-        "buy_signal": timing["buy_signal"],
-        "no_buy_reason": timing.get("no_buy_reason"),
-        "timing_note": timing["timing_note"],
-        "rationale": timing["rationale"],
-        "indicators": ind,
-        "signals": signal_obj,
-        "selected_strategies": strategies,
-    }
-    return AnalyzeResponse(**resp_dict)
+    # every field is produced here from typed values, so skip validation
+    return AnalyzeResponse.model_construct(
+        ticker=req.ticker,
+        buy_signal=timing["buy_signal"],
+        no_buy_reason=timing.get("no_buy_reason"),
+        timing_note=timing["timing_note"],
+        rationale=timing["rationale"],
+        indicators=IndicatorResp.model_construct(**ind),
+        signals=SignalsResp.model_construct(
+            raw=base.get("Recommendation", "HOLD"),
+            reasons=base.get("Reasons", "").split(" | ") if base.get("Reasons") else [],
+        ),
+        selected_strategies=[StrategyResp.model_construct(**s) for s in strategies],
+    )
+
+
+# expiry horizons the UI and clients commonly request
+WARMUP_DTE_DAYS = (30, 35, 45, 60)
+
+
+@app.on_event("startup")
+def _warm_up() -> None:
+    """Run one synthetic analysis so the first request finds warm caches."""
+    close = np.linspace(100.0, 120.0, 250)
+    history = pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + 1.0,
+            "Low": close - 1.0,
+            "Close": close,
+            "Volume": np.full(close.shape[0], 1e6),
+        }
+    )
+    _analyze_one(AnalyzeRequest(ticker="WARMUP"), history).model_dump()
+    for days in WARMUP_DTE_DAYS:
+        _expiry_iso(days)
 
 
 @app.post("/analyze", response_model=AnalyzeResponse)
-def analyze(req: AnalyzeRequest) -> AnalyzeResponse:
-    return _analyze_one(req)
+async def analyze(req: AnalyzeRequest) -> AnalyzeResponse:
+    return await anyio.to_thread.run_sync(_analyze_one, req)
 
 
 class BatchRequest(BaseModel):
@@ -133,13 +213,38 @@ class BatchRequest(BaseModel):
 
 
 @app.post("/batch", response_model=List[AnalyzeResponse])
-def batch(req: BatchRequest) -> List[AnalyzeResponse]:
-    return [_analyze_one(item) for item in req.items]
+async def batch(req: BatchRequest) -> List[AnalyzeResponse]:
+    # one multi-ticker download instead of a round-trip per item
+    try:
+        frames = await anyio.to_thread.run_sync(
+            fetch_history_batch, [item.ticker for item in req.items]
+        )
+    except Exception:
+        frames = {}
+    # tickers the download left empty are fetched on their own, as before
+    return list(
+        await asyncio.gather(
+            *(
+                anyio.to_thread.run_sync(_analyze_one, item, _prefetched(frames, item.ticker))
+                for item in req.items
+            )
+        )
+    )
 
 
 @app.post("/sell-decision")
-def sell_decision_endpoint(req: SellDecisionRequest) -> Dict[str, Any]:
+async def sell_decision_endpoint(req: SellDecisionRequest) -> Dict[str, Any]:
     pos = Position(**req.position.dict())
-    cfg_obj = SellConfig(**req.config.dict())
-    decision = decide_sell(pos, cfg_obj, prev_peak=req.prev_peak)
-    return decision
+    if req.config == _DEFAULT_SELL_CONFIG:
+        cfg_obj = _DEFAULT_SELL_CFG
+    else:
+        cfg_obj = SellConfig(**req.config.dict())
+    return await anyio.to_thread.run_sync(
+        partial(
+            decide_sell,
+            pos,
+            cfg_obj,
+            prev_peak=req.prev_peak,
+            snapshot=_fresh_snapshot(req.snapshot),
+        )
+    )
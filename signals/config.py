@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """Configuration thresholds for signal generation."""
 
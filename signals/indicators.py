@@ -2,36 +2,252 @@
 from __future__ import annotations
 
 from typing import Tuple
+import numpy as np
 import pandas as pd
 
+from ._kernels import _ewm_step
+from ._njit import njit, precompile, NUMBA_AVAILABLE
+
+try:
+    from scipy.signal import lfilter
+except ImportError:  # pragma: no cover - scipy is optional
+    lfilter = None
+
+
+@njit(cache=True)
+def _rsi_njit(close: np.ndarray, period: int) -> np.ndarray:
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    alpha = 1.0 / period
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n):
+        d = close[i] - close[i - 1]
+        gain = d if d > 0 else 0.0
+        loss = -d if d < 0 else 0.0
+        if i == 1:
+            avg_gain = gain
+            avg_loss = loss
+        else:
+            avg_gain = alpha * gain + (1.0 - alpha) * avg_gain
+            avg_loss = alpha * loss + (1.0 - alpha) * avg_loss
+        if i >= period:
+            # a zero average loss means RSI=100 (undefined when flat)
+            if avg_loss > 0:
+                out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            elif avg_gain > 0:
+                out[i] = 100.0
+    return out
+
+
+@njit(cache=True)
+def _macd_njit(
+    close: np.ndarray, a_fast: float, a_slow: float, a_sig: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Both EMAs, the MACD line and its signal EMA in one pass.
+
+    NaN closes hold both EMAs, as ``ewm(adjust=False)`` does.
+    """
+    n = close.shape[0]
+    line = np.empty(n)
+    sig = np.empty(n)
+    ema_fast = np.nan
+    ema_slow = np.nan
+    s = np.nan
+    skipped = 0
+    for i in range(n):
+        x = close[i]
+        if x == x:
+            ema_fast = _ewm_step(ema_fast, x, a_fast, skipped)
+            ema_slow = _ewm_step(ema_slow, x, a_slow, skipped)
+            skipped = 0
+        elif ema_fast == ema_fast:
+            skipped += 1
+        m = ema_fast - ema_slow
+        if m == m:
+            s = _ewm_step(s, m, a_sig, 0)
+        line[i] = m
+        sig[i] = s
+    return line, sig
+
+
+@njit(cache=True)
+def _wilder_njit(x: np.ndarray, period: int) -> np.ndarray:
+    """Wilder smoothing, i.e. ``ewm(alpha=1/period, adjust=False)``."""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    alpha = 1.0 / period
+    s = 0.0
+    for i in range(n):
+        s = x[i] if i == 0 else alpha * x[i] + (1.0 - alpha) * s
+        if i >= period - 1:
+            out[i] = s
+    return out
+
+
+@njit(cache=True)
+def _atr_njit(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """True range and Wilder smoothing fused into one pass."""
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    alpha = 1.0 / period
+    s = 0.0
+    for i in range(n):
+        tr = high[i] - low[i]
+        if i > 0:
+            # same NaN handling as np.fmax in _true_range
+            up = abs(high[i] - close[i - 1])
+            down = abs(low[i] - close[i - 1])
+            if up > tr or tr != tr:
+                tr = up
+            if down > tr or tr != tr:
+                tr = down
+        s = tr if i == 0 else alpha * tr + (1.0 - alpha) * s
+        if i >= period - 1:
+            out[i] = s
+    return out
+
+
+def _ema_lfilter(x: np.ndarray, alpha: float) -> np.ndarray:
+    """``ewm(alpha=alpha, adjust=False).mean()`` as a first-order IIR filter.
+
+    Works along the last axis, so a 2-D ``(tickers, bars)`` array is
+    smoothed in a single call.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if x.shape[-1] == 0:
+        return x.copy()
+    # seed the filter state so the first output equals the first input
+    out, _ = lfilter([alpha], [1.0, alpha - 1.0], x, axis=-1, zi=(1.0 - alpha) * x[..., :1])
+    return out
+
+
+def _wilder_lfilter(x: np.ndarray, period: int) -> np.ndarray:
+    """Matches :func:`_wilder_njit`, built on :func:`_ema_lfilter`."""
+    out = _ema_lfilter(x, 1.0 / period)
+    out[..., : period - 1] = np.nan
+    return out
+
+
+def _macd_lfilter(
+    close: np.ndarray, a_fast: float, a_slow: float, a_sig: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Matches :func:`_macd_njit` with three C-level filter passes."""
+    if np.isnan(close).any():
+        # the filter cannot skip gaps, so use the loop
+        return _macd_njit(close, a_fast, a_slow, a_sig)
+    line = _ema_lfilter(close, a_fast) - _ema_lfilter(close, a_slow)
+    # line[0] is zero, so the signal EMA starts from zero as in the loop
+    return line, _ema_lfilter(line, a_sig)
+
+
+def _rsi_lfilter(close: np.ndarray, period: int) -> np.ndarray:
+    """Vectorised :func:`_rsi_njit` built on :func:`_wilder_lfilter`."""
+    out = np.full(close.shape[0], np.nan)
+    if close.shape[0] < 2:
+        return out
+    d = np.diff(close)
+    avg_gain = _wilder_lfilter(np.where(d > 0, d, 0.0), period)
+    avg_loss = _wilder_lfilter(np.where(d < 0, -d, 0.0), period)
+    # masked division keeps float64 throughout; a zero average loss maps to
+    # rs=inf, i.e. RSI=100
+    rs = np.divide(avg_gain, avg_loss, out=np.full_like(avg_gain, np.inf), where=avg_loss > 0)
+    res = 100.0 - 100.0 / (1.0 + rs)
+    # warm-up bars and flat windows stay undefined
+    res[~(avg_gain > 0) & ~(avg_loss > 0)] = np.nan
+    out[1:] = res
+    return out
+
+
+# Compile the float64 signatures at import so the first request does not
+# pay for JIT compilation.
+precompile(_rsi_njit, "float64[::1]({a}, int64)")
+precompile(_wilder_njit, "float64[::1]({a}, int64)")
+precompile(_atr_njit, "float64[::1]({a}, {a}, {a}, int64)")
+precompile(_macd_njit, "UniTuple(float64[::1], 2)({a}, float64, float64, float64)")
+
+
+# The compiled loops win when Numba is present; otherwise lfilter keeps the
+# recursion in C instead of the interpreted fallback.
+if NUMBA_AVAILABLE or lfilter is None:
+    _wilder, _rsi, _macd = _wilder_njit, _rsi_njit, _macd_njit
+else:
+    _wilder, _rsi, _macd = _wilder_lfilter, _rsi_lfilter, _macd_lfilter
+
+
+def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    prev_close = np.empty_like(close)
+    prev_close[0] = np.nan
+    prev_close[1:] = close[:-1]
+    # Reduce pairwise into the high-low buffer rather than stacking a 3xN
+    # array; fmax skips the NaN previous close on the first bar.
+    tr = high - low
+    np.fmax(tr, np.abs(high - prev_close), out=tr)
+    np.subtract(low, prev_close, out=prev_close)
+    return np.fmax(tr, np.abs(prev_close, out=prev_close), out=tr)
+
+
+def _masked_cumsum(x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Cumulative sum with NaN counted as zero, and the running NaN count.
+
+    Both arrays lead with a zero, so a window ``[end - n, end)`` sums to
+    ``cs[end] - cs[end - n]``.
+    """
+    missing = np.isnan(x)
+    cs = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, x))))
+    cm = np.concatenate(([0], np.cumsum(missing)))
+    return cs, cm
+
+
+def _window_mean(cs: np.ndarray, cm: np.ndarray, period: int, ends: np.ndarray) -> np.ndarray:
+    """Means of the *period* bars before each index in *ends*.
+
+    Windows that start before the first bar or contain NaN are NaN, as with
+    ``rolling(period).mean()``.
+    """
+    ok = ends >= period
+    start = np.where(ok, ends - period, 0)
+    out = (cs[ends] - cs[start]) / period
+    out[~ok | (cm[ends] - cm[start] > 0)] = np.nan
+    return out
+
 
 def rsi(series: pd.Series, period: int = 14) -> pd.Series:
-    """Compute the Relative Strength Index."""
-    delta = series.diff()
-    gain = delta.clip(lower=0).rolling(period).mean()
-    loss = -delta.clip(upper=0).rolling(period).mean()
-    rs = gain / loss.replace({0: pd.NA})
-    return 100 - (100 / (1 + rs))
+    """Compute the Relative Strength Index with Wilder's smoothing."""
+    close = series.to_numpy(dtype=np.float64)
+    return pd.Series(_rsi(close, period), index=series.index)
 
 
 def sma(series: pd.Series, period: int) -> pd.Series:
-    """Simple moving average."""
-    return series.rolling(period).mean()
+    """Simple moving average.
+
+    Uses window differences of a cumulative sum, so the cost is O(N)
+    regardless of *period*.  Any window containing NaN is NaN, as with
+    ``rolling(period).mean()``.
+    """
+    x = series.to_numpy(dtype=np.float64)
+    out = np.full(x.shape[0], np.nan)
+    if period <= 0 or x.shape[0] < period:
+        return pd.Series(out, index=series.index, name=series.name)
+    cs, cm = _masked_cumsum(x)
+    out[period - 1 :] = _window_mean(cs, cm, period, np.arange(period, x.shape[0] + 1))
+    return pd.Series(out, index=series.index, name=series.name)
 
 
 def macd(series: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[pd.Series, pd.Series]:
     """Moving Average Convergence Divergence line and signal."""
-    ema_fast = series.ewm(span=fast, adjust=False).mean()
-    ema_slow = series.ewm(span=slow, adjust=False).mean()
-    macd_line = ema_fast - ema_slow
-    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-    return macd_line, signal_line
+    close = series.to_numpy(dtype=np.float64)
+    macd_line, signal_line = _macd(
+        close, 2.0 / (fast + 1), 2.0 / (slow + 1), 2.0 / (signal + 1)
+    )
+    return pd.Series(macd_line, index=series.index), pd.Series(signal_line, index=series.index)
 
 
 def atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
-    """Average True Range."""
-    high_low = df["High"] - df["Low"]
-    high_close = (df["High"] - df["Close"].shift()).abs()
-    low_close = (df["Low"] - df["Close"].shift()).abs()
-    tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-    return tr.rolling(period).mean()
+    """Average True Range with Wilder's smoothing."""
+    high = df["High"].to_numpy(dtype=np.float64)
+    low = df["Low"].to_numpy(dtype=np.float64)
+    close = df["Close"].to_numpy(dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return pd.Series(_atr_njit(high, low, close, period), index=df.index)
+    return pd.Series(_wilder(_true_range(high, low, close), period), index=df.index)
@@ -1,160 +1,250 @@
 """Options strategy selector and estimators."""
 from __future__ import annotations
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 import datetime as dt
+from functools import lru_cache
 
 from .config import Config
 
 
 def _nearest_monthly_expiry(days: int) -> dt.date:
-    target = dt.date.today() + dt.timedelta(days=days)
-    year, month = target.year, target.month
-    while True:
-        first = dt.date(year, month, 1)
-        first_friday = first + dt.timedelta(days=(4 - first.weekday()) % 7)
-        third_friday = first_friday + dt.timedelta(weeks=2)
-        if third_friday >= target:
-            return third_friday
-        month += 1
-        if month > 12:
-            month = 1
-            year += 1
-
-
-def _bull_call(px: float, cfg: Config) -> Dict[str, Any]:
-    long_strike = round(px)
-    short_strike = long_strike + cfg.bull_call_width
-    width = short_strike - long_strike
+    return _monthly_expiry_after(dt.date.today(), days)
+
+
+def _expiry_iso(days: int) -> str:
+    """ISO string of :func:`_nearest_monthly_expiry`, memoised per day."""
+    return _expiry_iso_on(dt.date.today(), days)
+
+
+# today is part of the key so cached expiries roll over at midnight
+@lru_cache(maxsize=64)
+def _expiry_iso_on(today: dt.date, days: int) -> str:
+    return _monthly_expiry_after(today, days).isoformat()
+
+
+def _third_friday(year: int, month: int) -> dt.date:
+    first = dt.date(year, month, 1)
+    return first + dt.timedelta(days=(4 - first.weekday()) % 7 + 14)
+
+
+def _monthly_expiry_after(today: dt.date, days: int) -> dt.date:
+    target = today + dt.timedelta(days=days)
+    expiry = _third_friday(target.year, target.month)
+    if expiry >= target:
+        return expiry
+    # past this month's expiry, so the next month's third Friday is the answer
+    if target.month == 12:
+        return _third_friday(target.year + 1, 1)
+    return _third_friday(target.year, target.month + 1)
+
+
+_DISCLAIMER = "Estimates (model), not live quotes"
+
+# Fields that never vary per call; builders splat these and add the
+# price-dependent parts.  ``why`` is a tuple so the shared value is immutable.
+_BULL_CALL = {
+    "name": "Bull Call Debit Spread",
+    "type": "Bullish",
+    "why": ("Low IV", "Defined risk", "Moderately bullish"),
+    "disclaimer": _DISCLAIMER,
+}
+_BULL_PUT = {
+    "name": "Bull Put Credit Spread",
+    "type": "Bullish",
+    "why": ("High IV", "Defined risk", "Bullish"),
+    "disclaimer": _DISCLAIMER,
+}
+_CASH_SECURED_PUT = {
+    "name": "Cash-Secured Put",
+    "type": "Income",
+    "why": ("High IV", "Willing to own shares"),
+    "disclaimer": _DISCLAIMER,
+}
+_COVERED_CALL = {
+    "name": "Covered Call",
+    "precondition": "Own ≥100 shares",
+    "type": "Income",
+    "why": ("Income", "Mild upside expected"),
+    "disclaimer": _DISCLAIMER,
+}
+_PROTECTIVE_PUT = {
+    "name": "Protective Put",
+    "type": "Defensive",
+    "why": ("Downside hedge",),
+    "disclaimer": _DISCLAIMER,
+}
+_IRON_CONDOR = {
+    "name": "Iron Condor",
+    "type": "Income",
+    "why": ("Range-bound", "Income"),
+    "disclaimer": _DISCLAIMER,
+}
+
+
+_OTHER_SIDE = {"LONG": "SHORT", "SHORT": "LONG"}
+
+
+# Strikes are rounded, so leg layouts repeat across calls and tickers.  The
+# cached tuples and their dicts are shared: callers copy the tuple into a
+# list and must not mutate the leg dicts.  ``typed`` keeps 100 and 100.0
+# apart so a strike's JSON form does not depend on cache history.
+@lru_cache(maxsize=4096, typed=True)
+def _single_leg(opt_type: str, side: str, strike: float) -> Tuple[Dict[str, Any], ...]:
+    return ({"type": opt_type, "side": side, "strike": strike},)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _vertical_legs(
+    opt_type: str, first_side: str, first_strike: float, second_strike: float
+) -> Tuple[Dict[str, Any], ...]:
+    return (
+        {"type": opt_type, "side": first_side, "strike": first_strike},
+        {"type": opt_type, "side": _OTHER_SIDE[first_side], "strike": second_strike},
+    )
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _condor_legs(
+    long_put: float, short_put: float, short_call: float, long_call: float
+) -> Tuple[Dict[str, Any], ...]:
+    return (
+        {"type": "PUT", "side": "LONG", "strike": long_put},
+        {"type": "PUT", "side": "SHORT", "strike": short_put},
+        {"type": "CALL", "side": "SHORT", "strike": short_call},
+        {"type": "CALL", "side": "LONG", "strike": long_call},
+    )
+
+
+# Builders below are pure functions of the rounded strikes, widths and
+# expiry, so nearby prices and reruns share one cached strategy.  Callers get
+# a copy from _fresh, with new legs and estimates containers.
+def _fresh(strategy: Dict[str, Any]) -> Dict[str, Any]:
+    return {**strategy, "legs": list(strategy["legs"]), "estimates": dict(strategy["estimates"])}
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _bull_call_at(long_strike: int, width: float, expiry: str) -> Dict[str, Any]:
+    short_strike = long_strike + width
     net_debit = round(width * 0.25, 2)
     max_profit = round(width - net_debit, 2)
     breakeven = round(long_strike + net_debit, 2)
     return {
-        "name": "Bull Call Debit Spread",
-        "type": "Bullish",
-        "expiry": _nearest_monthly_expiry(cfg.default_dte_days).isoformat(),
-        "legs": [
-            {"type": "CALL", "side": "LONG", "strike": long_strike},
-            {"type": "CALL", "side": "SHORT", "strike": short_strike},
-        ],
+        **_BULL_CALL,
+        "expiry": expiry,
+        "legs": _vertical_legs("CALL", "LONG", long_strike, short_strike),
         "estimates": {
             "net_debit": net_debit,
             "max_profit": max_profit,
             "max_loss": net_debit,
             "breakeven": breakeven,
         },
-        "why": ["Low IV", "Defined risk", "Moderately bullish"],
-        "disclaimer": "Estimates (model), not live quotes",
     }
 
 
-def _bull_put(px: float, cfg: Config) -> Dict[str, Any]:
-    short_strike = round(px * (1 - cfg.csp_otm_pct))
-    long_strike = short_strike - cfg.bull_put_width
-    width = short_strike - long_strike
+def _bull_call(px: float, cfg: Config, expiry: str) -> Dict[str, Any]:
+    return _fresh(_bull_call_at(round(px), cfg.bull_call_width, expiry))
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _bull_put_at(short_strike: int, width: float, expiry: str) -> Dict[str, Any]:
+    long_strike = short_strike - width
     net_credit = round(width * 0.3, 2)
     max_loss = round(width - net_credit, 2)
     breakeven = round(short_strike - net_credit, 2)
     return {
-        "name": "Bull Put Credit Spread",
-        "type": "Bullish",
-        "expiry": _nearest_monthly_expiry(cfg.default_dte_days).isoformat(),
-        "legs": [
-            {"type": "PUT", "side": "SHORT", "strike": short_strike},
-            {"type": "PUT", "side": "LONG", "strike": long_strike},
-        ],
+        **_BULL_PUT,
+        "expiry": expiry,
+        "legs": _vertical_legs("PUT", "SHORT", short_strike, long_strike),
         "estimates": {
             "net_credit": net_credit,
             "max_profit": net_credit,
             "max_loss": max_loss,
             "breakeven": breakeven,
         },
-        "why": ["High IV", "Defined risk", "Bullish"],
-        "disclaimer": "Estimates (model), not live quotes",
     }
 
 
-def _cash_secured_put(px: float, cfg: Config) -> Dict[str, Any]:
-    strike = round(px * (1 - cfg.csp_otm_pct))
+def _bull_put(px: float, cfg: Config, expiry: str) -> Dict[str, Any]:
+    return _fresh(_bull_put_at(round(px * (1 - cfg.csp_otm_pct)), cfg.bull_put_width, expiry))
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _cash_secured_put_at(strike: int, expiry: str) -> Dict[str, Any]:
     credit = round(strike * 0.1, 2)
     basis = round(strike - credit, 2)
     return {
-        "name": "Cash-Secured Put",
-        "type": "Income",
-        "expiry": _nearest_monthly_expiry(cfg.default_dte_days).isoformat(),
-        "legs": [{"type": "PUT", "side": "SHORT", "strike": strike}],
+        **_CASH_SECURED_PUT,
+        "expiry": expiry,
+        "legs": _single_leg("PUT", "SHORT", strike),
         "estimates": {"credit": credit, "assigned_basis": basis},
-        "why": ["High IV", "Willing to own shares"],
-        "disclaimer": "Estimates (model), not live quotes",
     }
 
 
-def _covered_call(px: float, cfg: Config) -> Dict[str, Any]:
-    strike = round(px * (1 + cfg.covered_call_otm_pct))
+def _cash_secured_put(px: float, cfg: Config, expiry: str) -> Dict[str, Any]:
+    return _fresh(_cash_secured_put_at(round(px * (1 - cfg.csp_otm_pct)), expiry))
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _covered_call_at(strike: int, expiry: str) -> Dict[str, Any]:
     credit = round(strike * 0.02, 2)
     return {
-        "name": "Covered Call",
-        "precondition": "Own ≥100 shares",
-        "type": "Income",
-        "expiry": _nearest_monthly_expiry(cfg.default_dte_days).isoformat(),
-        "legs": [{"type": "CALL", "side": "SHORT", "strike": strike}],
+        **_COVERED_CALL,
+        "expiry": expiry,
+        "legs": _single_leg("CALL", "SHORT", strike),
         "estimates": {"credit": credit, "capped_upside": True},
-        "why": ["Income", "Mild upside expected"],
-        "disclaimer": "Estimates (model), not live quotes",
     }
 
 
-def _protective_put(px: float, cfg: Config) -> Dict[str, Any]:
+def _covered_call(px: float, cfg: Config, expiry: str) -> Dict[str, Any]:
+    return _fresh(_covered_call_at(round(px * (1 + cfg.covered_call_otm_pct)), expiry))
+
+
+def _protective_put(px: float, cfg: Config, expiry: str) -> Dict[str, Any]:
+    # the cost tracks the unrounded price, so this one is not memoised
     strike = round(px * 0.95)
     cost = round(px * 0.02, 2)
     return {
-        "name": "Protective Put",
-        "type": "Defensive",
-        "expiry": _nearest_monthly_expiry(cfg.default_dte_days).isoformat(),
-        "legs": [{"type": "PUT", "side": "LONG", "strike": strike}],
+        **_PROTECTIVE_PUT,
+        "expiry": expiry,
+        "legs": list(_single_leg("PUT", "LONG", strike)),
         "estimates": {"cost": cost, "floor": strike},
-        "why": ["Downside hedge"],
-        "disclaimer": "Estimates (model), not live quotes",
     }
 
 
-def _iron_condor(px: float, cfg: Config) -> Dict[str, Any]:
-    width = cfg.bull_put_width
-    short_put = round(px * 0.95)
+@lru_cache(maxsize=4096, typed=True)
+def _iron_condor_at(short_put: int, short_call: int, width: float, expiry: str) -> Dict[str, Any]:
     long_put = short_put - width
-    short_call = round(px * 1.05)
     long_call = short_call + width
     credit = round(width * 0.5, 2)
     return {
-        "name": "Iron Condor",
-        "type": "Income",
-        "expiry": _nearest_monthly_expiry(cfg.default_dte_days).isoformat(),
-        "legs": [
-            {"type": "PUT", "side": "LONG", "strike": long_put},
-            {"type": "PUT", "side": "SHORT", "strike": short_put},
-            {"type": "CALL", "side": "SHORT", "strike": short_call},
-            {"type": "CALL", "side": "LONG", "strike": long_call},
-        ],
+        **_IRON_CONDOR,
+        "expiry": expiry,
+        "legs": _condor_legs(long_put, short_put, short_call, long_call),
         "estimates": {"net_credit": credit, "max_profit": credit, "max_loss": round(width - credit, 2)},
-        "why": ["Range-bound", "Income"],
-        "disclaimer": "Estimates (model), not live quotes",
     }
 
 
+def _iron_condor(px: float, cfg: Config, expiry: str) -> Dict[str, Any]:
+    return _fresh(_iron_condor_at(round(px * 0.95), round(px * 1.05), cfg.bull_put_width, expiry))
+
+
 def pick_strategies(px: float, iv_rank: Optional[float], holding_shares: int, cfg: Config, bullish: bool = True) -> List[Dict[str, Any]]:
     """Select strategies given price, volatility and bias."""
     strategies: List[Dict[str, Any]] = []
     high_iv = iv_rank is not None and iv_rank >= 30
+    # every strategy shares one expiry
+    expiry = _expiry_iso(cfg.default_dte_days)
 
     if bullish:
         if not high_iv:
-            strategies.append(_bull_call(px, cfg))
+            strategies.append(_bull_call(px, cfg, expiry))
         else:
-            strategies.append(_bull_put(px, cfg))
-            strategies.append(_cash_secured_put(px, cfg))
+            strategies.append(_bull_put(px, cfg, expiry))
+            strategies.append(_cash_secured_put(px, cfg, expiry))
         if holding_shares >= 100:
-            strategies.append(_covered_call(px, cfg))
+            strategies.append(_covered_call(px, cfg, expiry))
     else:
-        strategies.append(_protective_put(px, cfg))
-        strategies.append(_iron_condor(px, cfg))
+        strategies.append(_protective_put(px, cfg, expiry))
+        strategies.append(_iron_condor(px, cfg, expiry))
 
     return strategies
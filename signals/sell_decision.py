@@ -2,15 +2,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime, timezone
 from enum import Enum
+import threading
 from typing import Optional, Dict, Any
 
 import numpy as np
 import pandas as pd
 import yfinance as yf
 
-from .analysis import fetch_history, compute_core_indicators
+from .analysis import _SESSION, fetch_earnings_dates, fetch_history, compute_core_indicators
 
 
 class PositionType(str, Enum):
@@ -34,7 +35,7 @@ class Position:
     quantity: int = 1
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SellConfig:
     stop_loss_pct: float = 0.40
     take_profit_pct: float = 0.50
@@ -43,12 +44,32 @@ class SellConfig:
     breakeven_buffer: float = 2.0
 
 
-# store in-session peaks for trailing stop
+# store in-session peaks for trailing stop; bounded, least recently used
+# entries are evicted first
+PEAK_CACHE_SIZE = 10_000
 _PEAK_CACHE: Dict[str, float] = {}
+_peak_lock = threading.Lock()
 
 
 def _pos_key(pos: Position) -> str:
-    return f"{pos.ticker}-{pos.expiry}-{pos.type}-{pos.long_strike}-{pos.short_strike}"
+    return (
+        f"{pos.ticker}-{pos.expiry}-{pos.type}-{pos.long_strike}-{pos.short_strike}"
+        f"-{pos.entry_date}"
+    )
+
+
+def _update_peak(key: str, prev_peak: Optional[float], price: Optional[float]) -> Optional[float]:
+    """Fold *price* into the stored peak for *key* and return the new peak."""
+    with _peak_lock:
+        peak = prev_peak if prev_peak is not None else _PEAK_CACHE.get(key, price)
+        if price is not None:
+            peak = price if peak is None or price > peak else peak
+        _PEAK_CACHE.pop(key, None)
+        _PEAK_CACHE[key] = peak
+        # dicts keep insertion order, so the first entry is the oldest
+        while len(_PEAK_CACHE) > PEAK_CACHE_SIZE:
+            del _PEAK_CACHE[next(iter(_PEAK_CACHE))]
+    return peak
 
 
 def calc_spread_mark(long_last: float, short_last: float) -> float:
@@ -56,10 +77,30 @@ def calc_spread_mark(long_last: float, short_last: float) -> float:
     return float(long_last) - float(short_last)
 
 
+def _leg_mark(df: pd.DataFrame, strike: Optional[float], leg: str) -> float:
+    """Return the mid (or last trade when the quote is empty) for *strike*.
+
+    Yahoo returns chains sorted by strike, so the row is found by binary
+    search rather than a full boolean mask.
+    """
+    if strike is None:
+        raise ValueError(f"{leg} leg not found in chain")
+    strikes = df["strike"].to_numpy(dtype=np.float64)
+    i = int(np.searchsorted(strikes, strike))
+    if i >= strikes.shape[0] or strikes[i] != strike:
+        raise ValueError(f"{leg} leg not found in chain")
+    bid = float(df["bid"].iat[i])
+    ask = float(df["ask"].iat[i])
+    if not np.isnan(bid) and not np.isnan(ask) and bid > 0 and ask > 0:
+        return (bid + ask) / 2
+    col = "lastPrice" if "lastPrice" in df.columns else "last"
+    return float(df[col].iat[i]) if col in df.columns else np.nan
+
+
 def get_live_snapshot(position: Position) -> Dict[str, Any]:
     """Fetch live data for the position and underlying indicators."""
     ind = compute_core_indicators(position.ticker)
-    t = yf.Ticker(position.ticker)
+    t = yf.Ticker(position.ticker, session=_SESSION)
     expiry_str = position.expiry.isoformat()
     try:
         chain = t.option_chain(expiry_str)
@@ -67,31 +108,12 @@ def get_live_snapshot(position: Position) -> Dict[str, Any]:
         raise ValueError(f"Option chain fetch failed: {exc}")
 
     side = "puts" if position.type in {PositionType.LONG_PUT, PositionType.DEBIT_SPREAD_PUT} else "calls"
-    df_long = getattr(chain, side)
-    long_row = df_long[df_long["strike"] == position.long_strike]
-    if long_row.empty:
-        raise ValueError("Long leg not found in chain")
-    bid = float(long_row["bid"].iloc[0])
-    ask = float(long_row["ask"].iloc[0])
-    last = float(long_row.get("lastPrice", long_row.get("last", pd.Series([np.nan]))).iloc[0])
-    if not np.isnan(bid) and not np.isnan(ask) and bid > 0 and ask > 0:
-        long_last = (bid + ask) / 2
-    else:
-        long_last = last
+    df_side = getattr(chain, side)
+    long_last = _leg_mark(df_side, position.long_strike, "Long")
 
     short_last = None
     if position.type in {PositionType.DEBIT_SPREAD_CALL, PositionType.DEBIT_SPREAD_PUT}:
-        df_short = getattr(chain, side)
-        short_row = df_short[df_short["strike"] == position.short_strike]
-        if short_row.empty:
-            raise ValueError("Short leg not found in chain")
-        bid = float(short_row["bid"].iloc[0])
-        ask = float(short_row["ask"].iloc[0])
-        last = float(short_row.get("lastPrice", short_row.get("last", pd.Series([np.nan]))).iloc[0])
-        if not np.isnan(bid) and not np.isnan(ask) and bid > 0 and ask > 0:
-            short_last = (bid + ask) / 2
-        else:
-            short_last = last
+        short_last = _leg_mark(df_side, position.short_strike, "Short")
         spread_mark = calc_spread_mark(long_last, short_last)
     else:
         spread_mark = None
@@ -103,15 +125,19 @@ def get_live_snapshot(position: Position) -> Dict[str, Any]:
     else:
         breakeven -= position.entry_price
 
-    hist = fetch_history(position.ticker, period="6mo")
+    # Same period as compute_core_indicators above, so this is served from
+    # the history cache instead of a second download.
+    hist = fetch_history(position.ticker)
     above_bk_days = 0
     below_bk_days = 0
     if not hist.empty:
-        closes = hist["Close"]
-        above_bk_days = int((closes > breakeven).tail(2).sum())
-        below_bk_days = int((closes < breakeven).tail(2).sum())
+        # only the last two closes feed the breakeven counters
+        last2 = hist["Close"].to_numpy(dtype=np.float64)[-2:]
+        above_bk_days = int(np.count_nonzero(last2 > breakeven))
+        below_bk_days = int(np.count_nonzero(last2 < breakeven))
 
     snapshot: Dict[str, Any] = {
+        "as_of": datetime.now(timezone.utc).isoformat(),
         "underlying": ind["price"],
         "option_last": None if spread_mark is not None else long_last,
         "spread_mark": spread_mark,
@@ -129,7 +155,7 @@ def get_live_snapshot(position: Position) -> Dict[str, Any]:
     }
 
     try:  # optional earnings info
-        earn_df = t.get_earnings_dates(limit=1)
+        earn_df = fetch_earnings_dates(position.ticker)
         if not earn_df.empty:
             next_earn = earn_df.index[0].date()
             snapshot["earnings_in"] = (next_earn - date.today()).days
@@ -148,12 +174,10 @@ def decide_sell(
     """Decide whether to exit the option position."""
     snap = snapshot or get_live_snapshot(position)
     price = snap.get("option_last") or snap.get("spread_mark")
+    if price is not None:
+        price = float(price)
 
-    key = _pos_key(position)
-    peak = prev_peak if prev_peak is not None else _PEAK_CACHE.get(key, price)
-    if price is not None and price > (peak or 0):
-        peak = price
-    _PEAK_CACHE[key] = peak if peak is not None else price
+    peak = _update_peak(_pos_key(position), prev_peak, price)
 
     reasons = []
     action = "HOLD"
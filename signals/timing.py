@@ -3,11 +3,37 @@ from __future__ import annotations
 
 from typing import Dict, Any, List
 
+import numpy as np
+import pandas as pd
+
 from .config import Config
 
 
-def compute_buy_timing(ind: Dict[str, float], cfg: Config) -> Dict[str, Any]:
-    """Determine buy timing and rationale based on indicators."""
+def compute_buy_timing_bool(ind: Dict[str, float], cfg: Config) -> bool:
+    """Return only the ``buy_signal`` verdict of :func:`compute_buy_timing`."""
+    return bool(
+        ind["price"] > ind["sma200"]
+        and (ind["macd"] > ind["macd_signal"] or ind["sma20"] > ind["sma50"])
+        and ind["rsi14"] < cfg.rsi_overbought
+    )
+
+
+def compute_buy_timing(
+    ind: Dict[str, float], cfg: Config, collect_rationale: bool = True
+) -> Dict[str, Any]:
+    """Determine buy timing and rationale based on indicators.
+
+    With ``collect_rationale=False`` no note or rationale strings are built;
+    only ``buy_signal`` is filled in.
+    """
+    if not collect_rationale:
+        return {
+            "buy_signal": compute_buy_timing_bool(ind, cfg),
+            "timing_note": "",
+            "rationale": [],
+            "no_buy_reason": None,
+        }
+
     rationale: List[str] = []
 
     trend_ok = ind["price"] > ind["sma200"]
@@ -65,3 +91,20 @@ def compute_buy_timing(ind: Dict[str, float], cfg: Config) -> Dict[str, Any]:
         "rationale": rationale,
         "no_buy_reason": "; ".join(no_buy_reasons) if no_buy_reasons else None,
     }
+
+
+def compute_buy_timing_batch(ind_df: pd.DataFrame, cfg: Config) -> np.ndarray:
+    """Vectorised ``buy_signal`` of :func:`compute_buy_timing` for many tickers.
+
+    *ind_df* has one row per ticker with the indicator keys as columns.  Only
+    the boolean verdict is computed; use :func:`compute_buy_timing` for the
+    note and rationale of the rows that fire.
+    """
+    v = {
+        k: ind_df[k].to_numpy(dtype=np.float64)
+        for k in ("price", "sma20", "sma50", "sma200", "macd", "macd_signal", "rsi14")
+    }
+    trend_ok = v["price"] > v["sma200"]
+    momentum_ok = (v["macd"] > v["macd_signal"]) | (v["sma20"] > v["sma50"])
+    rsi_ok = v["rsi14"] < cfg.rsi_overbought
+    return trend_ok & momentum_ok & rsi_ok
@@ -46,3 +46,129 @@ def test_analyze_endpoint(monkeypatch):
     assert data.get("no_buy_reason") is None
     assert data["signals"]["raw"] == "BUY"
     assert "price" in data["indicators"]
+
+
+def test_core_indicators_are_cached(monkeypatch):
+    import numpy as np
+    import pandas as pd
+    import signals.analysis as analysis
+
+    calls = []
+    close = np.linspace(50.0, 150.0, 120)
+    df = pd.DataFrame(
+        {"High": close + 1, "Low": close - 1, "Close": close, "Volume": np.full(120, 1e6)}
+    )
+
+    def fake_fetch(ticker, period="1y", interval="1d"):
+        calls.append(ticker)
+        return df
+
+    monkeypatch.setattr(analysis, "fetch_history", fake_fetch)
+    monkeypatch.setattr(analysis, "_indicators", {})
+    first = analysis.compute_core_indicators("CACHE")
+    first["price"] = -1.0
+    second = analysis.compute_core_indicators("CACHE")
+    assert calls == ["CACHE"]
+    assert second["price"] == 150.0
+
+    stats = TestClient(api.app).get("/cache/stats").json()
+    assert stats["hits"] >= 1 and stats["size"] == 1
+
+
+def test_batch_prefetches_history(monkeypatch):
+    import numpy as np
+    import pandas as pd
+
+    close = np.linspace(50.0, 150.0, 250)
+    df = pd.DataFrame(
+        {"High": close + 1, "Low": close - 1, "Close": close, "Volume": np.full(250, 1e6)}
+    )
+    fetched = []
+
+    def fake_batch(tickers, period="1y", interval="1d"):
+        fetched.append(list(tickers))
+        return {t: df for t in tickers}
+
+    monkeypatch.setattr(api, "fetch_history_batch", fake_batch)
+    client = TestClient(api.app)
+    resp = client.post("/batch", json={"items": [{"ticker": "AAA"}, {"ticker": "BBB"}]})
+    assert resp.status_code == 200
+    assert fetched == [["AAA", "BBB"]]
+    assert [r["ticker"] for r in resp.json()] == ["AAA", "BBB"]
+    assert resp.json()[0]["indicators"]["price"] == 150.0
+
+
+def test_batch_refetches_tickers_missing_from_download(monkeypatch):
+    import numpy as np
+    import pandas as pd
+
+    close = np.linspace(50.0, 150.0, 250)
+    df = pd.DataFrame(
+        {"High": close + 1, "Low": close - 1, "Close": close, "Volume": np.full(250, 1e6)}
+    )
+    single = []
+
+    def fake_single(ticker, period="1y", interval="1d"):
+        single.append(ticker)
+        return df
+
+    monkeypatch.setattr(
+        api, "fetch_history_batch", lambda tickers: {"AAA1": df, "BBB1": pd.DataFrame()}
+    )
+    monkeypatch.setattr("signals.analysis.fetch_history", fake_single)
+    client = TestClient(api.app)
+    resp = client.post("/batch", json={"items": [{"ticker": "AAA1"}, {"ticker": "BBB1"}]})
+    assert resp.status_code == 200
+    assert set(single) == {"BBB1"}
+    assert resp.json()[1]["indicators"]["price"] == 150.0
+
+
+def test_sell_decision_uses_fresh_snapshot(monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    def no_fetch(_position):
+        raise AssertionError("live snapshot fetched")
+
+    monkeypatch.setattr("signals.sell_decision.get_live_snapshot", no_fetch)
+    snap = {
+        "as_of": datetime.now(timezone.utc).isoformat(),
+        "option_last": 4.0,
+        "underlying": 80.0,
+        "dte": 30,
+        "rsi14": 40.0,
+        "sma20": 90.0,
+        "sma50": 95.0,
+        "sma200": 100.0,
+        "macd": -1.0,
+        "macd_signal": 0.0,
+        "atr14": 5.0,
+        "breakeven": 90.0,
+    }
+    body = {
+        "position": {
+            "ticker": "TEST",
+            "type": "LONG_PUT",
+            "expiry": "2030-01-18",
+            "long_strike": 100,
+            "entry_price": 10.0,
+            "entry_date": "2029-12-01",
+        },
+        "snapshot": snap,
+    }
+    client = TestClient(api.app)
+    resp = client.post("/sell-decision", json=body)
+    assert resp.status_code == 200
+    assert resp.json()["action"] == "SELL_NOW"
+
+    stale = (datetime.now(timezone.utc) - timedelta(seconds=api.SNAPSHOT_MAX_AGE + 5)).isoformat()
+    assert api._fresh_snapshot({**snap, "as_of": stale}) is None
+    assert api._fresh_snapshot({k: v for k, v in snap.items() if k != "as_of"}) is None
+
+
+def test_startup_warms_caches():
+    from signals.options import _expiry_iso_on
+
+    _expiry_iso_on.cache_clear()
+    with TestClient(api.app):
+        pass
+    assert _expiry_iso_on.cache_info().currsize >= len(api.WARMUP_DTE_DAYS)
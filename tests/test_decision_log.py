@@ -0,0 +1,10 @@
+from automation.decision_log import append_decisions, read_recent
+
+
+def test_read_recent_returns_newest_first(tmp_path):
+    path = tmp_path / "decisions.jsonl"
+    append_decisions([{"n": i, "pad": "x" * 600} for i in range(100)], path)
+    recent = read_recent(5, path)
+    assert [r["n"] for r in recent] == [99, 98, 97, 96, 95]
+    assert len(read_recent(500, path)) == 100
+    assert read_recent(5, tmp_path / "missing.jsonl") == []
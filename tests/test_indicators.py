@@ -1,5 +1,13 @@
+import numpy as np
 import pandas as pd
-from signals.indicators import rsi, macd
+import pytest
+from signals._kernels import (
+    _macd_last_dot, _macd_last_njit, atr_last, macd_last, rsi_last, sma_last,
+)
+from signals.indicators import (
+    rsi, sma, macd, atr, _atr_njit, _ema_lfilter, _macd_lfilter, _macd_njit, _rsi_lfilter,
+    _rsi_njit, _true_range, _wilder_lfilter, _wilder_njit,
+)
 
 
 def test_rsi_smoothing():
@@ -16,3 +24,120 @@ def test_macd_direction():
     macd_down, sig_down = macd(down, 3, 6, 3)
     assert macd_up.iloc[-1] > sig_up.iloc[-1]
     assert macd_down.iloc[-1] < sig_down.iloc[-1]
+
+
+def test_rsi_wilder_bounds():
+    down = pd.Series([30 - i for i in range(1, 30)], dtype=float)
+    res = rsi(down, 14)
+    assert res.iloc[:14].isna().all()
+    assert res.iloc[-1] == 0.0
+
+
+def test_atr_constant_range():
+    close = pd.Series([100.0] * 30)
+    df = pd.DataFrame({"High": close + 1.0, "Low": close - 1.0, "Close": close})
+    res = atr(df, 14)
+    assert res.iloc[:13].isna().all()
+    assert abs(res.iloc[-1] - 2.0) < 1e-12
+
+
+def test_wilder_lfilter_matches_loop():
+    pytest.importorskip("scipy")
+    x = np.abs(np.random.default_rng(0).normal(size=(3, 40)))
+    res = _wilder_lfilter(x, 14)
+    for row, out in zip(x, res):
+        np.testing.assert_allclose(out, _wilder_njit(row, 14), equal_nan=True)
+
+
+def test_last_value_kernels_match_series():
+    rng = np.random.default_rng(1)
+    close = pd.Series(100 + np.cumsum(rng.normal(size=80)))
+    df = pd.DataFrame({"High": close + 1.0, "Low": close - 1.0, "Close": close})
+    x = close.to_numpy()
+    assert np.isclose(rsi_last(x, 14), rsi(close, 14).iloc[-1])
+    line, sig = macd(close, 12, 26, 9)
+    assert np.allclose(macd_last(x, 12, 26, 9), (line.iloc[-1], sig.iloc[-1]))
+    assert np.isclose(atr_last(df["High"].to_numpy(), df["Low"].to_numpy(), x, 14), atr(df, 14).iloc[-1])
+    assert np.isclose(sma_last(x, 20), close.rolling(20).mean().iloc[-1])
+
+
+def test_fused_atr_matches_true_range():
+    rng = np.random.default_rng(2)
+    close = 100 + np.cumsum(rng.normal(size=60))
+    high = close + rng.uniform(0, 2, 60)
+    low = close - rng.uniform(0, 2, 60)
+    low[10] = np.nan
+    expected = _wilder_njit(_true_range(high, low, close), 14)
+    np.testing.assert_allclose(_atr_njit(high, low, close, 14), expected, equal_nan=True)
+
+
+def test_rsi_lfilter_matches_loop():
+    pytest.importorskip("scipy")
+    close = 100 + np.cumsum(np.random.default_rng(3).normal(size=60))
+    close[20:24] = close[19]
+    np.testing.assert_allclose(_rsi_lfilter(close, 14), _rsi_njit(close, 14), equal_nan=True)
+    flat = np.full(30, 5.0)
+    assert np.isnan(_rsi_lfilter(flat, 14)).all()
+
+
+def test_sma_matches_rolling_mean():
+    close = pd.Series(100 + np.cumsum(np.random.default_rng(4).normal(size=80)))
+    close.iloc[30] = np.nan
+    pd.testing.assert_series_equal(sma(close, 20), close.rolling(20).mean())
+
+
+def test_macd_last_dot_matches_loop():
+    x = 100 + np.cumsum(np.random.default_rng(5).normal(size=120))
+    np.testing.assert_allclose(_macd_last_dot(x, 12, 26, 9), _macd_last_njit(x, 12, 26, 9))
+
+
+def test_ema_lfilter_matches_ewm():
+    pytest.importorskip("scipy")
+    close = pd.Series(100 + np.cumsum(np.random.default_rng(6).normal(size=120)))
+    for span in (9, 12, 26):
+        expected = close.ewm(span=span, adjust=False).mean().to_numpy()
+        np.testing.assert_allclose(_ema_lfilter(close.to_numpy(), 2 / (span + 1)), expected, rtol=1e-12)
+    alphas = (2 / 13, 2 / 27, 2 / 10)
+    for got, want in zip(_macd_lfilter(close.to_numpy(), *alphas), _macd_njit(close.to_numpy(), *alphas)):
+        np.testing.assert_allclose(got, want, rtol=1e-12, atol=1e-12)
+
+
+def test_compute_all_sma_recovers_after_missing_close():
+    from signals.analysis import compute_all
+
+    close = pd.Series(100 + np.cumsum(np.random.default_rng(7).normal(size=250)))
+    close.iloc[100] = np.nan
+    df = pd.DataFrame(
+        {"High": close + 1, "Low": close - 1, "Close": close, "Volume": np.full(250, 1e6)}
+    )
+    ind, _ = compute_all("TEST", 1.0, 1.0, df=df)
+    for n in (20, 50):
+        assert np.isclose(ind[f"sma{n}"], close.rolling(n).mean().iloc[-1])
+    assert np.isnan(ind["sma200"]) and np.isnan(close.rolling(200).mean().iloc[-1])
+
+
+def test_atr_last_matches_series_with_missing_bars():
+    rng = np.random.default_rng(8)
+    close = pd.Series(100 + np.cumsum(rng.normal(size=80)))
+    df = pd.DataFrame({"High": close + 1.0, "Low": close - 1.0, "Close": close})
+    df.loc[40, "Close"] = np.nan
+    df.loc[60, "High"] = np.nan
+    args = (df["High"].to_numpy(), df["Low"].to_numpy(), df["Close"].to_numpy(), 14)
+    expected = atr(df, 14).iloc[-1]
+    assert np.isfinite(expected)
+    assert np.isclose(atr_last(*args), expected)
+
+
+def test_macd_skips_missing_closes_like_ewm():
+    close = pd.Series(100 + np.cumsum(np.random.default_rng(9).normal(size=120)))
+    close.iloc[[0, 40, 41, 90]] = np.nan
+    ema_fast = close.ewm(span=12, adjust=False).mean()
+    ema_slow = close.ewm(span=26, adjust=False).mean()
+    line = ema_fast - ema_slow
+    sig = line.ewm(span=9, adjust=False).mean()
+    got_line, got_sig = macd(close, 12, 26, 9)
+    np.testing.assert_allclose(got_line, line, rtol=1e-10, atol=1e-10)
+    np.testing.assert_allclose(got_sig, sig, rtol=1e-10, atol=1e-10)
+    x = close.to_numpy()
+    for last in (_macd_last_njit, _macd_last_dot):
+        np.testing.assert_allclose(last(x, 12, 26, 9), (line.iloc[-1], sig.iloc[-1]), rtol=1e-10)
@@ -1,8 +1,16 @@
+import contextvars
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
 from app import store, monitor
+from signals import analysis
 
 
 def setup_function(_):
+    store.engine.dispose()
     if os.path.exists(store.DB_PATH):
         os.remove(store.DB_PATH)
     store.Base.metadata.create_all(store.engine)
@@ -31,3 +39,28 @@ def test_run_once_triggers_notifier(monkeypatch):
     res = monitor.run_monitor_once()
     assert res[0]["decision"] == "SELL_NOW"
     assert calls
+
+
+def test_overlapping_runs_keep_their_own_history_memo():
+    # an interval with no TTL only ever lives in the per-run memo
+    key = ("TEST", "1y", "1wk")
+    df = pd.DataFrame({"Close": [1.0]})
+    entered, release = threading.Event(), threading.Event()
+
+    def other_run():
+        with analysis.shared_history():
+            entered.set()
+            release.wait()
+
+    with analysis.shared_history():
+        analysis._cache_put(key, df)
+        t = threading.Thread(target=other_run)
+        t.start()
+        entered.wait()
+        release.set()
+        t.join()
+        assert analysis._cache_get(key) is df
+        ctx = contextvars.copy_context()
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            assert ex.submit(ctx.run, analysis._cache_get, key).result() is df
+    assert analysis._cache_get(key) is None
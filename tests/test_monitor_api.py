@@ -6,6 +6,7 @@ from app import store, monitor
 
 
 def setup_function(_):
+    store.engine.dispose()
     if os.path.exists(store.DB_PATH):
         os.remove(store.DB_PATH)
     store.Base.metadata.create_all(store.engine)
@@ -52,3 +53,22 @@ def test_api_crud_and_schedule(monkeypatch):
 
     client.delete(f"/positions/{pid}")
     assert client.get("/positions").json() == []
+
+
+def test_bootstrap_bundles_monitor_view():
+    client = TestClient(app)
+    client.post(
+        "/positions",
+        json={
+            "ticker": "msft",
+            "type": "LONG_PUT",
+            "expiry": "2030-01-01",
+            "long_strike": 300.0,
+            "entry_price": 2.0,
+        },
+    )
+    boot = client.get("/bootstrap").json()
+    assert [p["ticker"] for p in boot["positions"]] == ["MSFT"]
+    assert boot["settings"]["poll_minutes"] == client.get("/settings").json()["poll_minutes"]
+    assert boot["status"] == client.get("/monitor/status").json()
+    assert isinstance(boot["recent"], list)
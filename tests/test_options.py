@@ -38,3 +38,13 @@ def test_defensive_strategies():
     names = [s["name"] for s in strategies]
     assert "Protective Put" in names
     assert any(s["type"] == "Defensive" for s in strategies)
+
+
+def test_cached_strategies_are_independent_copies():
+    cfg = Config()
+    first = pick_strategies(px=100.2, iv_rank=10, holding_shares=0, cfg=cfg)[0]
+    first["estimates"]["net_debit"] = 0
+    first["legs"].clear()
+    again = pick_strategies(px=99.8, iv_rank=10, holding_shares=0, cfg=cfg)[0]
+    assert again["estimates"]["net_debit"] == 5.0
+    assert len(again["legs"]) == 2
@@ -1,7 +1,10 @@
+import numpy as np
 import pandas as pd
+import pytest
 from fastapi.testclient import TestClient
 
-from backend.core.signals.qvm import QVMWeights, compute_qvm_scores
+from backend.core.signals import qvm
+from backend.core.signals.qvm import QVMWeights, compute_qvm_scores, compute_qvm_scores_records
 from backend.apps.api.main import app
 
 
@@ -34,3 +37,57 @@ def test_screen_endpoint():
     data = response.json()
     assert len(data) == 4
     assert {"qvm_score", "quality_z", "value_z", "momentum_z"}.issubset(data[0].keys())
+
+
+def test_polars_path_matches_pandas(monkeypatch):
+    pytest.importorskip("polars")
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "ticker": [f"T{i}" for i in range(30)],
+            "sector": ["Tech", "Health", "Energy"] * 10,
+            "quality": rng.normal(size=30),
+            "value": rng.normal(size=30),
+            "momentum": rng.normal(size=30),
+        }
+    )
+    expected = compute_qvm_scores(df)
+    monkeypatch.setattr(qvm, "POLARS_MIN_ROWS", 0)
+    result = compute_qvm_scores(df)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_records_path_matches_dataframe():
+    df = sample_df()
+    expected = compute_qvm_scores(df, weights=QVMWeights())
+    rows = compute_qvm_scores_records(df.to_dict(orient="records"), QVMWeights())
+    scores = {r["ticker"]: r["qvm_score"] for r in rows}
+    assert np.allclose([scores[t] for t in expected["ticker"]], expected["qvm_score"])
+    assert [r["qvm_score"] for r in rows] == sorted(scores.values(), reverse=True)
+
+
+def test_constant_sector_has_nan_zscores():
+    df = sample_df()
+    df.loc[df["sector"] == "Health", "quality"] = 0.1
+    result = compute_qvm_scores(df)
+    health = result[result["sector"] == "Health"]
+    assert health["quality_z"].isna().all()
+    assert result.loc[result["sector"] == "Tech", "quality_z"].notna().all()
+
+
+def test_polars_constant_sector_matches_pandas(monkeypatch):
+    pytest.importorskip("polars")
+    df = pd.DataFrame(
+        {
+            "ticker": [f"T{i}" for i in range(6)],
+            "sector": ["Tech"] * 3 + ["Health"] * 3,
+            "quality": [0.1, 0.1, 0.1, 1.0, 2.0, 4.0],
+            "value": [0.3, 0.7, 0.2, 5.0, 5.0, 5.0],
+            "momentum": [1.0, 2.0, 3.0, 3.0, 1.0, 2.0],
+        }
+    )
+    expected = compute_qvm_scores(df)
+    monkeypatch.setattr(qvm, "POLARS_MIN_ROWS", 0)
+    result = compute_qvm_scores(df)
+    assert np.isfinite(result["qvm_score"]).all()
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
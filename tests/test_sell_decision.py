@@ -90,3 +90,34 @@ def test_breakeven_buffer_exit():
 
 def test_spread_mark_calc():
     assert calc_spread_mark(5.5, 2.0) == 3.5
+
+
+def test_peak_cache_is_bounded(monkeypatch):
+    import signals.sell_decision as sd
+
+    monkeypatch.setattr(sd, "_PEAK_CACHE", {})
+    monkeypatch.setattr(sd, "PEAK_CACHE_SIZE", 2)
+    sd._update_peak("a", None, 1.0)
+    sd._update_peak("b", None, 2.0)
+    assert sd._update_peak("a", None, 0.5) == 1.0
+    sd._update_peak("c", None, 3.0)
+    assert list(sd._PEAK_CACHE) == ["a", "c"]
+
+
+def test_leg_mark_uses_mid_or_last():
+    import pandas as pd
+    import pytest
+    from signals.sell_decision import _leg_mark
+
+    chain = pd.DataFrame(
+        {
+            "strike": [90.0, 95.0, 100.0],
+            "bid": [10.0, 0.0, 2.0],
+            "ask": [11.0, 6.0, 3.0],
+            "lastPrice": [10.4, 5.5, 2.4],
+        }
+    )
+    assert _leg_mark(chain, 100.0, "Long") == 2.5
+    assert _leg_mark(chain, 95.0, "Long") == 5.5
+    with pytest.raises(ValueError):
+        _leg_mark(chain, 97.5, "Short")
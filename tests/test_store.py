@@ -3,6 +3,7 @@ from app import store
 
 
 def setup_function(_):
+    store.engine.dispose()
     if os.path.exists(store.DB_PATH):
         os.remove(store.DB_PATH)
     store.Base.metadata.create_all(store.engine)
@@ -31,3 +32,27 @@ def test_store_crud_and_settings():
     assert s.poll_minutes == 10
     s2 = store.update_settings(poll_minutes=5, notify_slack=1)
     assert s2.poll_minutes == 5 and s2.notify_slack == 1
+
+
+def test_snapshot_read_overlapping_a_write_is_not_cached(monkeypatch):
+    store._invalidate_reads()
+    p = store.create_position(
+        {
+            "ticker": "AAPL",
+            "type": "LONG_CALL",
+            "expiry": "2030-01-01",
+            "long_strike": 100.0,
+            "entry_price": 1.0,
+        }
+    )
+    real_list = store.list_positions
+
+    def list_then_delete():
+        rows = real_list()
+        store.delete_position(p.id)  # lands while the snapshot is reading
+        return rows
+
+    monkeypatch.setattr(store, "list_positions", list_then_delete)
+    assert len(store.monitor_snapshot()[1]) == 1
+    monkeypatch.setattr(store, "list_positions", real_list)
+    assert store.monitor_snapshot()[1] == []
@@ -1,4 +1,6 @@
-from signals.timing import compute_buy_timing
+import pandas as pd
+
+from signals.timing import compute_buy_timing, compute_buy_timing_batch, compute_buy_timing_bool
 from signals.config import Config
 
 
@@ -31,3 +33,29 @@ def test_overbought_no_buy():
     res = compute_buy_timing(ind, cfg)
     assert res["buy_signal"] is False
     assert "RSI overbought" in res["no_buy_reason"]
+
+
+def test_batch_matches_single():
+    base = {
+        "price": 110.0,
+        "sma20": 105.0,
+        "sma50": 102.0,
+        "sma200": 100.0,
+        "macd": 1.0,
+        "macd_signal": 0.5,
+        "rsi14": 55.0,
+    }
+    rows = [
+        base,
+        {**base, "rsi14": 75.0},
+        {**base, "price": 90.0},
+        {**base, "macd": 0.0, "sma20": 101.0},
+        {**base, "macd": 0.0},
+        {**base, "sma200": float("nan")},
+    ]
+    cfg = Config()
+    expected = [compute_buy_timing(r, cfg)["buy_signal"] for r in rows]
+    assert compute_buy_timing_batch(pd.DataFrame(rows), cfg).tolist() == expected
+    assert [compute_buy_timing_bool(r, cfg) for r in rows] == expected
+    quiet = compute_buy_timing(rows[0], cfg, collect_rationale=False)
+    assert quiet["buy_signal"] is True and quiet["rationale"] == []
@@ -0,0 +1,143 @@
+"""Position monitor tab of the Streamlit UI."""
+from __future__ import annotations
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+import streamlit as st
+
+# Module state survives reruns, so API calls reuse pooled keep-alive
+# connections; connect fast-fails, reads get a few seconds.
+API_TIMEOUT = (1, 5)
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+def render_monitor_tab():
+    st.markdown('<h1 class="main-header">📊 Position Monitor</h1>', unsafe_allow_html=True)
+    
+    # API connection status
+    base_url = st.secrets.get("api_url", "http://localhost:8000") if "api_url" in st.secrets else "http://localhost:8000"
+    
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        st.info(f"🔗 API Endpoint: {base_url}")
+    with col2:
+        if st.button("🔌 Test Connection", use_container_width=True):
+            test_api_connection(base_url)
+    with col3:
+        if st.button("🔄 Refresh Data", use_container_width=True):
+            fetch_positions(base_url)
+    
+    # Auto-load positions
+    if not st.session_state.positions_loaded:
+        fetch_positions(base_url)
+    
+    # Display positions
+    if st.session_state.positions_data:
+        display_positions()
+    else:
+        st.info("📭 No positions found. Add some positions to get started!")
+        if st.button("➕ Add Your First Position", type="primary"):
+            st.switch_page("add_position")
+
+def display_positions():
+    st.subheader("📋 Current Positions")
+    
+    df = pd.DataFrame(st.session_state.positions_data)
+    
+    # Summary metrics
+    total_positions = len(df)
+    enabled_positions = sum(1 for p in st.session_state.positions_data if p.get('enabled', 1))
+    
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Total Positions", total_positions)
+    col2.metric("Active Positions", enabled_positions)
+    col3.metric("Inactive Positions", total_positions - enabled_positions)
+    
+    # Positions table
+    st.dataframe(df, use_container_width=True)
+    
+    # Position actions
+    st.subheader("🎛️ Position Actions")
+    
+    for pos in st.session_state.positions_data:
+        with st.expander(f"📊 {pos['ticker']} - {pos['type']} (Exp: {pos['expiry']})"):
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                enabled_status = "✅ Enabled" if pos.get('enabled', 1) else "❌ Disabled"
+                st.write(f"**Status:** {enabled_status}")
+                st.write(f"**Strike:** ${pos['long_strike']}")
+            
+            with col2:
+                st.write(f"**Entry:** ${pos['entry_price']}")
+                st.write(f"**Quantity:** {pos['quantity']}")
+            
+            with col3:
+                if st.button("🔄 Toggle Status", key=f"toggle_{pos['id']}"):
+                    toggle_position(pos['id'])
+                
+            with col4:
+                if st.button("🗑️ Delete", key=f"delete_{pos['id']}", type="secondary"):
+                    delete_position(pos['id'])
+
+def test_api_connection(base_url):
+    try:
+        with st.spinner("Testing API connection..."):
+            response = _SESSION.get(f"{base_url}/health", timeout=API_TIMEOUT)
+            if response.status_code == 200:
+                st.success("✅ API Connected Successfully!")
+            else:
+                st.error(f"❌ API health check failed: {response.status_code}")
+    except requests.exceptions.RequestException as e:
+        st.error(f"❌ API connection failed: {e}")
+        st.info("💡 Make sure to start the API server with: `uvicorn app.api:app --reload`")
+
+# Every rerun renders the sidebar stats; a short TTL folds those GETs into
+# one. fetch_positions clears it so explicit refreshes and writes are fresh.
+@st.cache_data(ttl=5, show_spinner=False)
+def _get_positions(base_url):
+    response = _SESSION.get(f"{base_url}/positions", timeout=API_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+def fetch_positions(base_url):
+    try:
+        with st.spinner("Fetching positions..."):
+            _get_positions.clear()
+            st.session_state.positions_data = _get_positions(base_url)
+            st.session_state.positions_loaded = True
+            return True
+    except requests.exceptions.HTTPError as e:
+        st.error(f"Failed to fetch positions: {e.response.status_code}")
+        return False
+    except requests.exceptions.RequestException as e:
+        st.error(f"Error fetching positions: {e}")
+        return False
+
+def toggle_position(position_id):
+    base_url = st.secrets.get("api_url", "http://localhost:8000") if "api_url" in st.secrets else "http://localhost:8000"
+    try:
+        response = _SESSION.post(f"{base_url}/positions/{position_id}/toggle", timeout=API_TIMEOUT)
+        if response.status_code == 200:
+            st.success("Position toggled!")
+            fetch_positions(base_url)
+            st.rerun()
+        else:
+            st.error("Failed to toggle position")
+    except Exception as e:
+        st.error(f"Error toggling position: {e}")
+
+def delete_position(position_id):
+    base_url = st.secrets.get("api_url", "http://localhost:8000") if "api_url" in st.secrets else "http://localhost:8000"
+    try:
+        response = _SESSION.delete(f"{base_url}/positions/{position_id}", timeout=API_TIMEOUT)
+        if response.status_code == 200:
+            st.success("Position deleted!")
+            fetch_positions(base_url)
+            st.rerun()
+        else:
+            st.error("Failed to delete position")
+    except Exception as e:
+        st.error(f"Error deleting position: {e}")
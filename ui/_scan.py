@@ -0,0 +1,239 @@
+"""Signal scanner tab of the Streamlit UI."""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+
+import pandas as pd
+import streamlit as st
+
+from signals import (
+    Config,
+    compute_all,
+    compute_buy_timing,
+    compute_buy_timing_bool,
+    pick_strategies,
+)
+from signals.analysis import fetch_history, fetch_history_batch
+from signals.indicators import sma
+
+cfg = Config()
+
+SCAN_WORKERS = 16
+REC_ORDER = ["BUY", "SELL", "HOLD"]
+
+def render_scan_tab():
+    st.markdown('<h1 class="main-header">🔍 Signal Scanner</h1>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.subheader("📊 Ticker Analysis")
+        
+        # Quick preset buttons
+        st.markdown("**Quick Presets:**")
+        preset_col1, preset_col2, preset_col3 = st.columns(3)
+        
+        with preset_col1:
+            if st.button("🔥 Popular Stocks", use_container_width=True):
+                st.session_state.analysis_tickers = "AAPL,MSFT,GOOGL,AMZN,TSLA"
+        with preset_col2:
+            if st.button("💎 Tech Giants", use_container_width=True):
+                st.session_state.analysis_tickers = "AAPL,MSFT,GOOGL,META,NVDA"
+        with preset_col3:
+            if st.button("📈 Growth Stocks", use_container_width=True):
+                st.session_state.analysis_tickers = "TSLA,NVDA,AMD,CRM,SNOW"
+        
+        # Manual input
+        manual_tickers = st.text_input(
+            "Enter Tickers (comma-separated)", 
+            value=st.session_state.get("analysis_tickers", "AAPL,MSFT,GOOGL"),
+            key="manual_tickers",
+            help="Enter stock symbols separated by commas"
+        )
+        
+        # Analysis options
+        col_opt1, col_opt2 = st.columns(2)
+        with col_opt1:
+            show_timing = st.checkbox("📅 Show Buy Timing", value=True)
+            show_chart = st.checkbox("📊 Show Price Chart", value=True)
+        with col_opt2:
+            show_opts = st.checkbox("🎯 Show Options Strategies", value=True)
+            export_csv = st.checkbox("💾 Enable CSV Export", value=False)
+        
+        # Run analysis button
+        if st.button("🚀 Run Analysis", type="primary", use_container_width=True):
+            if manual_tickers:
+                run_analysis(manual_tickers, show_timing, show_opts, show_chart, export_csv)
+            else:
+                st.error("Please enter at least one ticker symbol")
+    
+    with col2:
+        st.subheader("📝 Watchlist Manager")
+        
+        # Add to watchlist
+        new_ticker = st.text_input("Add ticker", placeholder="e.g., AAPL")
+        if st.button("➕ Add to Watchlist", use_container_width=True) and new_ticker:
+            ticker = new_ticker.strip().upper()
+            if ticker and ticker not in st.session_state.watchlist:
+                st.session_state.watchlist.append(ticker)
+                st.success(f"Added {ticker} to watchlist!")
+                st.rerun()
+        
+        # Display watchlist
+        if st.session_state.watchlist:
+            st.markdown("**Your Watchlist:**")
+            selected_tickers = []
+            
+            for ticker in st.session_state.watchlist:
+                col_check, col_remove = st.columns([3, 1])
+                with col_check:
+                    if st.checkbox(ticker, key=f"select_{ticker}"):
+                        selected_tickers.append(ticker)
+                with col_remove:
+                    if st.button("🗑️", key=f"remove_{ticker}", help="Remove"):
+                        st.session_state.watchlist.remove(ticker)
+                        st.rerun()
+            
+            if selected_tickers:
+                if st.button(f"🏃 Analyze Selected ({len(selected_tickers)})", 
+                           type="secondary", use_container_width=True):
+                    run_analysis(",".join(selected_tickers), True, True, True, False)
+        
+        # Settings panel
+        st.markdown("---")
+        st.subheader("⚙️ Analysis Settings")
+        min_price = st.number_input("Min Price ($)", value=cfg.min_price, step=0.01)
+        min_vol = st.number_input("Min Avg Volume ($M)", value=cfg.min_avg_dollar_vol/1000000, step=1.0)
+
+# Toggling display options reruns the script; reuse indicators for 15 minutes
+# instead of refetching. "Refresh All Data" clears this cache.
+@st.cache_data(ttl=900, show_spinner=False)
+def _cached_compute_all(ticker):
+    return compute_all(ticker, cfg.min_price, cfg.min_avg_dollar_vol)
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _cached_history(ticker):
+    return fetch_history(ticker)
+
+def _analyze_row(ticker, show_timing, show_opts):
+    """Build one scanner row; runs in a worker thread, so no st.* calls."""
+    try:
+        ind, row = _cached_compute_all(ticker)
+    except ValueError as exc:
+        ind, row = None, {"Ticker": ticker, "Error": str(exc)}
+        timing = {"buy_signal": False, "timing_note": str(exc), "rationale": []}
+    else:
+        timing = compute_buy_timing(ind, cfg) if show_timing else None
+
+    if show_timing:
+        row["BuySignal"] = "✅ Yes" if timing["buy_signal"] else "❌ No"
+        row["TimingNote"] = timing["timing_note"]
+    if show_opts and ind:
+        # the strategy pick only needs the verdict, not the formatted notes
+        bullish = timing["buy_signal"] if timing else compute_buy_timing_bool(ind, cfg)
+        strategies = pick_strategies(ind["price"], None, 0, cfg, bullish)
+        row["StrategyCount"] = len(strategies)
+    return row
+
+def run_analysis(tickers_str, show_timing, show_opts, show_chart, export_csv):
+    tickers = [t.strip().upper() for t in tickers_str.split(",") if t.strip()]
+    
+    if not tickers:
+        st.error("No valid tickers provided")
+        return
+    
+    st.success(f"🔍 Analyzing {len(tickers)} tickers: {', '.join(tickers)}")
+    
+    # Progress tracking
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+    results_container = st.container()
+    
+    # One yf.download for every ticker not already cached; the workers then
+    # read their history from the shared cache instead of one request each.
+    status_text.text(f"Downloading history for {len(tickers)} tickers...")
+    try:
+        fetch_history_batch(tickers)
+    except Exception:
+        pass  # workers fall back to per-ticker fetches
+    
+    # Indicator work per ticker overlaps in the pool; rows keep ticker order.
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(tickers))) as ex:
+        futures = {ex.submit(_analyze_row, t, show_timing, show_opts): t for t in tickers}
+        for done, fut in enumerate(as_completed(futures), 1):
+            ticker = futures[fut]
+            status_text.text(f"Analyzed {ticker} ({done}/{len(tickers)})")
+            progress_bar.progress(done / len(tickers))
+            try:
+                results[ticker] = fut.result()
+            except Exception as e:
+                st.error(f"Error analyzing {ticker}: {e}")
+    rows = [results[t] for t in tickers if t in results]
+    
+    status_text.empty()
+    progress_bar.empty()
+    
+    if rows:
+        with results_container:
+            display_results(rows, tickers, show_timing, show_opts, show_chart, export_csv)
+
+def display_results(rows, tickers, show_timing, show_opts, show_chart, export_csv):
+    st.subheader("📊 Analysis Results")
+    
+    # Create results dataframe, ordered BUY/SELL/HOLD like the CLI; failed
+    # tickers have no Recommendation and sort last
+    df = pd.DataFrame(rows)
+    if "Recommendation" in df:
+        df = df.sort_values(
+            "Recommendation",
+            key=lambda s: pd.Categorical(s, categories=REC_ORDER, ordered=True),
+            kind="stable",
+            na_position="last",
+        )
+    
+    # Display summary metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    buy_signals = int((df["BuySignal"] == "✅ Yes").sum()) if "BuySignal" in df else 0
+    strong_buy = int((df["Recommendation"] == "Strong Buy").sum()) if "Recommendation" in df else 0
+    
+    col1.metric("📈 Buy Signals", f"{buy_signals}/{len(rows)}")
+    col2.metric("🎯 Strong Buys", strong_buy)
+    col3.metric("📊 Analyzed", len(rows))
+    col4.metric("⚠️ Warnings", len(rows) - buy_signals)
+    
+    # Display results table
+    display_cols = [c for c in ("Ticker", "Recommendation", "Reasons") if c in df]
+    if show_timing:
+        display_cols.extend(["BuySignal", "TimingNote"])
+    if show_opts:
+        display_cols.append("StrategyCount")
+    
+    st.dataframe(df[display_cols], use_container_width=True)
+    
+    # Export option
+    if export_csv:
+        csv = df.to_csv(index=False).encode("utf-8")
+        st.download_button(
+            "📥 Download Results CSV",
+            data=csv,
+            file_name=f"signals_{date.today()}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+    
+    # Chart for first ticker
+    if show_chart and tickers:
+        try:
+            st.subheader(f"📈 Price Chart - {tickers[0]}")
+            hist = _cached_history(tickers[0])
+            if not hist.empty:
+                close = hist["Close"]
+                chart_df = pd.DataFrame(
+                    {"Close": close, **{f"SMA{n}": sma(close, n) for n in (20, 50, 200)}}
+                )
+                st.line_chart(chart_df, use_container_width=True)
+        except Exception as e:
+            st.warning(f"Could not load chart: {e}")
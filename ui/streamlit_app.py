@@ -13,22 +13,14 @@ import streamlit as st
 # Ensure the repository root is on sys.path when running via `streamlit run`
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from signals import (
-    Config,
-    analyze_ticker,
-    compute_core_indicators,
-    compute_buy_timing,
-    pick_strategies,
-)
-from signals.analysis import fetch_history
 from signals.sell_decision import (
     Position,
     PositionType,
     SellConfig,
     decide_sell,
 )
-
-cfg = Config()
+from ui._monitor import API_TIMEOUT, _SESSION, _get_positions, fetch_positions, render_monitor_tab
+from ui._scan import cfg, render_scan_tab
 
 # Page configuration
 st.set_page_config(
@@ -100,14 +92,12 @@ def create_navigation():
     # Try to get position count
     try:
         base_url = st.secrets.get("api_url", "http://localhost:8000")
-        response = requests.get(f"{base_url}/positions", timeout=3)
-        if response.status_code == 200:
-            positions = response.json()
-            st.sidebar.metric("Active Positions", len(positions))
-            enabled_count = sum(1 for p in positions if p.get('enabled', 1))
-            st.sidebar.metric("Enabled Positions", enabled_count)
-        else:
-            st.sidebar.info("API not connected")
+        positions = _get_positions(base_url)
+        st.sidebar.metric("Active Positions", len(positions))
+        enabled_count = sum(1 for p in positions if p.get('enabled', 1))
+        st.sidebar.metric("Enabled Positions", enabled_count)
+    except requests.exceptions.HTTPError:
+        st.sidebar.info("API not connected")
     except:
         st.sidebar.info("API not available")
     
@@ -121,7 +111,7 @@ def create_navigation():
     
     if st.sidebar.button("📊 Test API Connection"):
         try:
-            response = requests.get(f"{base_url}/health", timeout=3)
+            response = _SESSION.get(f"{base_url}/health", timeout=API_TIMEOUT)
             if response.status_code == 200:
                 st.sidebar.success("✅ API Connected")
             else:
@@ -139,263 +129,6 @@ if "positions_data" not in st.session_state:
 if "positions_loaded" not in st.session_state:
     st.session_state.positions_loaded = False
 
-def render_scanner_page():
-    st.markdown('<h1 class="main-header">🔍 Signal Scanner</h1>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        st.subheader("📊 Ticker Analysis")
-        
-        # Quick preset buttons
-        st.markdown("**Quick Presets:**")
-        preset_col1, preset_col2, preset_col3 = st.columns(3)
-        
-        with preset_col1:
-            if st.button("🔥 Popular Stocks", use_container_width=True):
-                st.session_state.analysis_tickers = "AAPL,MSFT,GOOGL,AMZN,TSLA"
-        with preset_col2:
-            if st.button("💎 Tech Giants", use_container_width=True):
-                st.session_state.analysis_tickers = "AAPL,MSFT,GOOGL,META,NVDA"
-        with preset_col3:
-            if st.button("📈 Growth Stocks", use_container_width=True):
-                st.session_state.analysis_tickers = "TSLA,NVDA,AMD,CRM,SNOW"
-        
-        # Manual input
-        manual_tickers = st.text_input(
-            "Enter Tickers (comma-separated)", 
-            value=st.session_state.get("analysis_tickers", "AAPL,MSFT,GOOGL"),
-            key="manual_tickers",
-            help="Enter stock symbols separated by commas"
-        )
-        
-        # Analysis options
-        col_opt1, col_opt2 = st.columns(2)
-        with col_opt1:
-            show_timing = st.checkbox("📅 Show Buy Timing", value=True)
-            show_chart = st.checkbox("📊 Show Price Chart", value=True)
-        with col_opt2:
-            show_opts = st.checkbox("🎯 Show Options Strategies", value=True)
-            export_csv = st.checkbox("💾 Enable CSV Export", value=False)
-        
-        # Run analysis button
-        if st.button("🚀 Run Analysis", type="primary", use_container_width=True):
-            if manual_tickers:
-                run_analysis(manual_tickers, show_timing, show_opts, show_chart, export_csv)
-            else:
-                st.error("Please enter at least one ticker symbol")
-    
-    with col2:
-        st.subheader("📝 Watchlist Manager")
-        
-        # Add to watchlist
-        new_ticker = st.text_input("Add ticker", placeholder="e.g., AAPL")
-        if st.button("➕ Add to Watchlist", use_container_width=True) and new_ticker:
-            ticker = new_ticker.strip().upper()
-            if ticker and ticker not in st.session_state.watchlist:
-                st.session_state.watchlist.append(ticker)
-                st.success(f"Added {ticker} to watchlist!")
-                st.rerun()
-        
-        # Display watchlist
-        if st.session_state.watchlist:
-            st.markdown("**Your Watchlist:**")
-            selected_tickers = []
-            
-            for ticker in st.session_state.watchlist:
-                col_check, col_remove = st.columns([3, 1])
-                with col_check:
-                    if st.checkbox(ticker, key=f"select_{ticker}"):
-                        selected_tickers.append(ticker)
-                with col_remove:
-                    if st.button("🗑️", key=f"remove_{ticker}", help="Remove"):
-                        st.session_state.watchlist.remove(ticker)
-                        st.rerun()
-            
-            if selected_tickers:
-                if st.button(f"🏃 Analyze Selected ({len(selected_tickers)})", 
-                           type="secondary", use_container_width=True):
-                    run_analysis(",".join(selected_tickers), True, True, True, False)
-        
-        # Settings panel
-        st.markdown("---")
-        st.subheader("⚙️ Analysis Settings")
-        min_price = st.number_input("Min Price ($)", value=cfg.min_price, step=0.01)
-        min_vol = st.number_input("Min Avg Volume ($M)", value=cfg.min_avg_dollar_vol/1000000, step=1.0)
-
-def run_analysis(tickers_str, show_timing, show_opts, show_chart, export_csv):
-    tickers = [t.strip().upper() for t in tickers_str.split(",") if t.strip()]
-    
-    if not tickers:
-        st.error("No valid tickers provided")
-        return
-    
-    st.success(f"🔍 Analyzing {len(tickers)} tickers: {', '.join(tickers)}")
-    
-    # Progress tracking
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    results_container = st.container()
-    
-    rows = []
-    
-    for i, ticker in enumerate(tickers):
-        status_text.text(f"Analyzing {ticker}... ({i+1}/{len(tickers)})")
-        progress_bar.progress((i + 1) / len(tickers))
-        
-        try:
-            row = analyze_ticker(ticker, cfg.min_price, cfg.min_avg_dollar_vol)
-            
-            if show_timing or show_opts:
-                try:
-                    ind = compute_core_indicators(ticker)
-                    timing = compute_buy_timing(ind, cfg)
-                except Exception as exc:
-                    timing = {"buy_signal": False, "timing_note": str(exc), "rationale": []}
-                    ind = None
-                    
-                if show_timing:
-                    row["BuySignal"] = "✅ Yes" if timing["buy_signal"] else "❌ No"
-                    row["TimingNote"] = timing["timing_note"]
-                    
-                if show_opts and ind:
-                    strategies = pick_strategies(ind["price"], None, 0, cfg, timing["buy_signal"])
-                    row["StrategyCount"] = len(strategies)
-                    
-            rows.append(row)
-            
-        except Exception as e:
-            st.error(f"Error analyzing {ticker}: {e}")
-    
-    status_text.empty()
-    progress_bar.empty()
-    
-    if rows:
-        with results_container:
-            display_results(rows, tickers, show_timing, show_opts, show_chart, export_csv)
-
-def display_results(rows, tickers, show_timing, show_opts, show_chart, export_csv):
-    st.subheader("📊 Analysis Results")
-    
-    # Create results dataframe
-    df = pd.DataFrame(rows)
-    
-    # Display summary metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    buy_signals = sum(1 for r in rows if r.get("BuySignal") == "✅ Yes")
-    strong_buy = sum(1 for r in rows if r.get("Recommendation") == "Strong Buy")
-    
-    col1.metric("📈 Buy Signals", f"{buy_signals}/{len(rows)}")
-    col2.metric("🎯 Strong Buys", strong_buy)
-    col3.metric("📊 Analyzed", len(rows))
-    col4.metric("⚠️ Warnings", len(rows) - buy_signals)
-    
-    # Display results table
-    display_cols = ["Ticker", "Recommendation", "Reasons"]
-    if show_timing:
-        display_cols.extend(["BuySignal", "TimingNote"])
-    if show_opts:
-        display_cols.append("StrategyCount")
-    
-    st.dataframe(df[display_cols], use_container_width=True)
-    
-    # Export option
-    if export_csv:
-        csv = df.to_csv(index=False).encode("utf-8")
-        st.download_button(
-            "📥 Download Results CSV",
-            data=csv,
-            file_name=f"signals_{date.today()}.csv",
-            mime="text/csv",
-            use_container_width=True
-        )
-    
-    # Chart for first ticker
-    if show_chart and tickers:
-        try:
-            st.subheader(f"📈 Price Chart - {tickers[0]}")
-            hist = fetch_history(tickers[0])
-            if not hist.empty:
-                chart_df = pd.DataFrame({
-                    "Close": hist["Close"],
-                    "SMA20": hist["Close"].rolling(20).mean(),
-                    "SMA50": hist["Close"].rolling(50).mean(),
-                    "SMA200": hist["Close"].rolling(200).mean(),
-                })
-                st.line_chart(chart_df, use_container_width=True)
-        except Exception as e:
-            st.warning(f"Could not load chart: {e}")
-
-def render_monitor_page():
-    st.markdown('<h1 class="main-header">📊 Position Monitor</h1>', unsafe_allow_html=True)
-    
-    # API connection status
-    base_url = st.secrets.get("api_url", "http://localhost:8000") if "api_url" in st.secrets else "http://localhost:8000"
-    
-    col1, col2, col3 = st.columns([2, 1, 1])
-    with col1:
-        st.info(f"🔗 API Endpoint: {base_url}")
-    with col2:
-        if st.button("🔌 Test Connection", use_container_width=True):
-            test_api_connection(base_url)
-    with col3:
-        if st.button("🔄 Refresh Data", use_container_width=True):
-            fetch_positions(base_url)
-    
-    # Auto-load positions
-    if not st.session_state.positions_loaded:
-        fetch_positions(base_url)
-    
-    # Display positions
-    if st.session_state.positions_data:
-        display_positions()
-    else:
-        st.info("📭 No positions found. Add some positions to get started!")
-        if st.button("➕ Add Your First Position", type="primary"):
-            st.switch_page("add_position")
-
-def display_positions():
-    st.subheader("📋 Current Positions")
-    
-    df = pd.DataFrame(st.session_state.positions_data)
-    
-    # Summary metrics
-    total_positions = len(df)
-    enabled_positions = sum(1 for p in st.session_state.positions_data if p.get('enabled', 1))
-    
-    col1, col2, col3 = st.columns(3)
-    col1.metric("Total Positions", total_positions)
-    col2.metric("Active Positions", enabled_positions)
-    col3.metric("Inactive Positions", total_positions - enabled_positions)
-    
-    # Positions table
-    st.dataframe(df, use_container_width=True)
-    
-    # Position actions
-    st.subheader("🎛️ Position Actions")
-    
-    for pos in st.session_state.positions_data:
-        with st.expander(f"📊 {pos['ticker']} - {pos['type']} (Exp: {pos['expiry']})"):
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                enabled_status = "✅ Enabled" if pos.get('enabled', 1) else "❌ Disabled"
-                st.write(f"**Status:** {enabled_status}")
-                st.write(f"**Strike:** ${pos['long_strike']}")
-            
-            with col2:
-                st.write(f"**Entry:** ${pos['entry_price']}")
-                st.write(f"**Quantity:** {pos['quantity']}")
-            
-            with col3:
-                if st.button("🔄 Toggle Status", key=f"toggle_{pos['id']}"):
-                    toggle_position(pos['id'])
-                
-            with col4:
-                if st.button("🗑️ Delete", key=f"delete_{pos['id']}", type="secondary"):
-                    delete_position(pos['id'])
-
 def render_add_position_page():
     st.markdown('<h1 class="main-header">➕ Add New Position</h1>', unsafe_allow_html=True)
     
@@ -502,7 +235,7 @@ def save_position_to_db(position_data):
     
     try:
         with st.spinner("💾 Saving position to database..."):
-            response = requests.post(f"{base_url}/positions", json=position_data, timeout=10)
+            response = _SESSION.post(f"{base_url}/positions", json=position_data, timeout=API_TIMEOUT)
             if response.status_code == 200:
                 st.success("✅ Position saved successfully!")
                 st.balloons()
@@ -661,68 +394,14 @@ def render_settings_page():
     if st.button("💾 Save All Settings"):
         st.success("All settings saved successfully!")
 
-# Helper functions
-def test_api_connection(base_url):
-    try:
-        with st.spinner("Testing API connection..."):
-            response = requests.get(f"{base_url}/health", timeout=5)
-            if response.status_code == 200:
-                st.success("✅ API Connected Successfully!")
-            else:
-                st.error(f"❌ API health check failed: {response.status_code}")
-    except requests.exceptions.RequestException as e:
-        st.error(f"❌ API connection failed: {e}")
-        st.info("💡 Make sure to start the API server with: `uvicorn app.api:app --reload`")
-
-def fetch_positions(base_url):
-    try:
-        with st.spinner("Fetching positions..."):
-            response = requests.get(f"{base_url}/positions", timeout=10)
-            if response.status_code == 200:
-                st.session_state.positions_data = response.json()
-                st.session_state.positions_loaded = True
-                return True
-            else:
-                st.error(f"Failed to fetch positions: {response.status_code}")
-                return False
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching positions: {e}")
-        return False
-
-def toggle_position(position_id):
-    base_url = st.secrets.get("api_url", "http://localhost:8000") if "api_url" in st.secrets else "http://localhost:8000"
-    try:
-        response = requests.post(f"{base_url}/positions/{position_id}/toggle", timeout=5)
-        if response.status_code == 200:
-            st.success("Position toggled!")
-            fetch_positions(base_url)
-            st.rerun()
-        else:
-            st.error("Failed to toggle position")
-    except Exception as e:
-        st.error(f"Error toggling position: {e}")
-
-def delete_position(position_id):
-    base_url = st.secrets.get("api_url", "http://localhost:8000") if "api_url" in st.secrets else "http://localhost:8000"
-    try:
-        response = requests.delete(f"{base_url}/positions/{position_id}", timeout=5)
-        if response.status_code == 200:
-            st.success("Position deleted!")
-            fetch_positions(base_url)
-            st.rerun()
-        else:
-            st.error("Failed to delete position")
-    except Exception as e:
-        st.error(f"Error deleting position: {e}")
-
 # Main app
 def main():
     selected_page = create_navigation()
     
     if selected_page == "scanner":
-        render_scanner_page()
+        render_scan_tab()
     elif selected_page == "monitor":
-        render_monitor_page()
+        render_monitor_tab()
     elif selected_page == "add_position":
         render_add_position_page()
     elif selected_page == "analysis":